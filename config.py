@@ -3,9 +3,15 @@ Configuration file for Transition Scout - SMB Retirement Planning Lead Generator
 """
 
 import os
+import functools
 from dotenv import load_dotenv
 
-load_dotenv()
+@functools.lru_cache(maxsize=1)
+def load_env():
+    """Load .env into the environment once per process"""
+    load_dotenv()
+
+load_env()
 
 # Target Business Criteria - Maryland High School Financial Education Focus
 TARGET_CRITERIA = {
@@ -54,6 +60,11 @@ GEOGRAPHIC_TARGETS = {
     ]
 }
 
+# Precomputed lookups so scoring code doesn't rescan the lists above
+TARGET_INDUSTRIES_SET = frozenset(industry.lower() for industry in TARGET_CRITERIA["target_industries"])
+TARGET_CITIES_SET = frozenset(city.lower() for city in GEOGRAPHIC_TARGETS["cities"])
+TARGET_STATES_SET = frozenset(GEOGRAPHIC_TARGETS["states"])
+
 # API Configuration
 API_CONFIG = {
     "linkedin": {
@@ -79,6 +90,19 @@ API_CONFIG = {
 SCRAPING_CONFIG = {
     "max_results_per_location": 100,
     "delay_between_requests": 2,  # seconds
+    "api_requests_per_second": 5,  # per API host
+    "enrich_workers": 32,
+    "scrape_workers": 8,
+    "hunter_workers": 5,  # concurrent Hunter.io domain searches
+    "hunter_requests_per_second": 15,  # Hunter.io plan rate limit
+    "max_concurrent_per_host": 2,
+    "linkedin_driver_pool_size": 4,  # idle Chrome sessions kept for reuse
+    "linkedin_session_max_idle": 25 * 60,  # seconds before an idle session is refreshed on checkout
+    "api_cache_path": "enricher_cache",  # SQLite file for cached API responses
+    "api_cache_ttl": 86400,  # seconds
+    "hunter_cache_path": "hunter_cache",  # SQLite file for cached Hunter.io domain searches
+    "hunter_cache_ttl": 7 * 86400,  # seconds; organization data changes slowly
+    "apollo_batch_size": 10,  # domains per Apollo bulk organization lookup
     "max_retries": 3,
     "user_agent_rotation": True,
     "proxy_rotation": False
@@ -99,7 +123,8 @@ OUTPUT_CONFIG = {
     "max_leads_per_batch": 50,
     "output_format": "both",  # excel, csv, or both
     "include_outreach_templates": True,
-    "include_contact_verification": True
+    "include_contact_verification": True,
+    "template_workers": 8  # threads rendering outreach templates on free-threaded Python
 }
 
 # Outreach Templates - Maryland High School Financial Education Focus
@@ -4,23 +4,139 @@ Scrapes actual companies from public business directories
 """
 
 import requests
-from bs4 import BeautifulSoup
-import time
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 import re
 from urllib.parse import urljoin, urlparse
-import random
+
+from config import SCRAPING_CONFIG
+from data_collectors.http_session import configure_session
+from data_collectors.models import DirectoryListing
+from data_collectors.rate_limiter import HostRateLimiter
+
+_YEARS_RE = re.compile(r'(\d+)')
+
+# Listings kept from each results page
+_RESULTS_PER_PAGE = 20
+
+# Legal suffixes ignored when matching company names across directories
+_LEGAL_SUFFIX_RE = re.compile(r'\b(?:inc|llc|ltd|corp|corporation|co|company)\W*$')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# Only the listing containers are built into the parse tree; the rest of each page is skipped
+_YELLOW_PAGES_LISTINGS = SoupStrainer('div', class_='result')
+_YELP_LISTINGS = SoupStrainer('div', attrs={'data-testid': 'serp-ia-card'})
+_GOOGLE_LISTINGS = SoupStrainer('div', class_='rllt__details')
+
+
+def _text(node) -> str:
+    return node.get_text(strip=True)
+
+
+def _href(node) -> Optional[str]:
+    return node.get('href')
+
+
+def _joined_text(nodes) -> str:
+    return ', '.join([node.get_text(strip=True) for node in nodes])
+
+
+def _years(node) -> Optional[int]:
+    years_match = _YEARS_RE.search(node.get_text(strip=True))
+    return int(years_match.group(1)) if years_match else None
+
+
+# Listing schemas: (finder, tag, attrs, [(field, extractor), ...]); fields sharing a selector share one lookup
+_YELLOW_PAGES_SCHEMA = (
+    ('find', 'a', {'class': 'business-name'}, (('company_name', _text), ('website', _href))),
+    ('find', 'div', {'class': 'phones phone primary'}, (('phone', _text),)),
+    ('find', 'div', {'class': 'street-address'}, (('address', _text),)),
+    ('find_all', 'a', {'class': 'category'}, (('industry', _joined_text),)),
+    ('find', 'div', {'class': 'years-in-business'}, (('years_in_business', _years),)),
+)
+_YELP_SCHEMA = (
+    ('find', 'a', {'data-testid': 'business-link'}, (('company_name', _text), ('yelp_url', _href))),
+    ('find', 'span', {'data-testid': 'review-count'}, (('review_count', _text),)),
+    ('find_all', 'span', {'class': 'css-1heecm'}, (('industry', _joined_text),)),
+    ('find', 'span', {'data-testid': 'address'}, (('address', _text),)),
+)
+_GOOGLE_SCHEMA = (
+    ('find', 'div', {'class': 'dbg0pd'}, (('company_name', _text),)),
+    ('find', 'span', {'class': 'LrzXr'}, (('address', _text),)),
+    ('find', 'span', {'class': 'LrzXr zdqRlf'}, (('phone', _text),)),
+)
+
+
+def _build_parser(schema: Tuple) -> Callable[..., Optional[DirectoryListing]]:
+    """Build a listing parser for a directory schema; listings without a company name are dropped"""
+    def parse(element) -> Optional[DirectoryListing]:
+        values = {}
+        for finder, tag, attrs, extractors in schema:
+            node = getattr(element, finder)(tag, attrs)
+            if node:
+                for field, extract in extractors:
+                    value = extract(node)
+                    if value is not None:
+                        values[field] = value
+        
+        return DirectoryListing(**values) if values.get('company_name') else None
+    
+    return parse
+
+
+_parse_yellow_pages_result = _build_parser(_YELLOW_PAGES_SCHEMA)
+_parse_yelp_result = _build_parser(_YELP_SCHEMA)
+_parse_google_result = _build_parser(_GOOGLE_SCHEMA)
 
 class BusinessDirectoryScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self._local = threading.local()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        # A single-token bucket per host spaces requests at least delay_between_requests apart
+        self.rate_limiter = HostRateLimiter(capacity=1, rate=1 / SCRAPING_CONFIG["delay_between_requests"])
         self.logger = logging.getLogger(__name__)
+    
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread HTTP session, since directories are scraped concurrently"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = configure_session(requests.Session())
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            })
+            self._local.session = session
+        return session
+    
+    def _fetch(self, url: str) -> requests.Response:
+        """GET a page, pacing requests and capping how many are in flight to the same host"""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = self._host_slots[host] = threading.BoundedSemaphore(SCRAPING_CONFIG["max_concurrent_per_host"])
+        
+        with slots:
+            self.rate_limiter.acquire(url)
+            response = self.session.get(url)
+        response.raise_for_status()
+        return response
+    
+    def _fetch_pages(self, page_urls: List[str]) -> Iterator[requests.Response]:
+        """Yield responses in order, fetching the next page while the caller parses the current one"""
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self._fetch, page_urls[0])
+            for next_url in page_urls[1:]:
+                response = pending.result()
+                pending = prefetcher.submit(self._fetch, next_url)
+                yield response
+            yield pending.result()
         
-    def scrape_yellow_pages(self, location: str, industry: str = None) -> List[Dict]:
+    def scrape_yellow_pages(self, location: str, industry: str = None) -> List[DirectoryListing]:
         """Scrape real companies from Yellow Pages"""
         companies = []
         
@@ -33,71 +149,36 @@ class BusinessDirectoryScraper:
             
             self.logger.info(f"Scraping Yellow Pages: {search_url}")
             
-            response = self.session.get(search_url)
-            response.raise_for_status()
+            max_results = SCRAPING_CONFIG["max_results_per_location"]
+            max_pages = -(-max_results // _RESULTS_PER_PAGE)
+            page_urls = [search_url] + [f"{search_url}&page={page}" for page in range(2, max_pages + 1)]
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find business listings
-            business_elements = soup.find_all('div', class_='result')
-            
-            for element in business_elements[:20]:  # Limit to first 20 results
-                try:
-                    company_data = self._parse_yellow_pages_result(element)
-                    if company_data:
-                        companies.append(company_data)
-                        time.sleep(random.uniform(1, 3))  # Respectful scraping
-                        
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse business element: {str(e)}")
-                    continue
+            for response in self._fetch_pages(page_urls):
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=_YELLOW_PAGES_LISTINGS)
+                
+                # Find business listings
+                business_elements = soup.find_all('div', class_='result')
+                
+                for element in business_elements[:_RESULTS_PER_PAGE]:
+                    try:
+                        listing = _parse_yellow_pages_result(element)
+                        if listing:
+                            companies.append(listing)
+                            
+                    except Exception as e:
+                        self.logger.warning(f"Failed to parse business element: {str(e)}")
+                        continue
+                
+                # Stop paging once the results run out or enough listings have been collected
+                if not business_elements or len(companies) >= max_results:
+                    break
                     
         except Exception as e:
             self.logger.error(f"Yellow Pages scraping failed: {str(e)}")
             
-        return companies
-    
-    def _parse_yellow_pages_result(self, element) -> Optional[Dict]:
-        """Parse individual Yellow Pages business result"""
-        try:
-            company_data = {}
-            
-            # Company name
-            name_element = element.find('a', class_='business-name')
-            if name_element:
-                company_data['company_name'] = name_element.get_text(strip=True)
-                company_data['website'] = name_element.get('href')
-            
-            # Phone number
-            phone_element = element.find('div', class_='phones phone primary')
-            if phone_element:
-                company_data['phone'] = phone_element.get_text(strip=True)
-            
-            # Address
-            address_element = element.find('div', class_='street-address')
-            if address_element:
-                company_data['address'] = address_element.get_text(strip=True)
-            
-            # Categories/Industry
-            categories = element.find_all('a', class_='category')
-            if categories:
-                company_data['industry'] = ', '.join([cat.get_text(strip=True) for cat in categories])
-            
-            # Years in business (if available)
-            years_element = element.find('div', class_='years-in-business')
-            if years_element:
-                years_text = years_element.get_text(strip=True)
-                years_match = re.search(r'(\d+)', years_text)
-                if years_match:
-                    company_data['years_in_business'] = int(years_match.group(1))
-            
-            return company_data if company_data.get('company_name') else None
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse Yellow Pages result: {str(e)}")
-            return None
+        return companies[:SCRAPING_CONFIG["max_results_per_location"]]
     
-    def scrape_yelp_business(self, location: str, industry: str = None) -> List[Dict]:
+    def scrape_yelp_business(self, location: str, industry: str = None) -> List[DirectoryListing]:
         """Scrape real companies from Yelp Business"""
         companies = []
         
@@ -110,20 +191,18 @@ class BusinessDirectoryScraper:
             
             self.logger.info(f"Scraping Yelp Business: {search_url}")
             
-            response = self.session.get(search_url)
-            response.raise_for_status()
+            response = self._fetch(search_url)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_YELP_LISTINGS)
             
             # Find business listings
             business_elements = soup.find_all('div', {'data-testid': 'serp-ia-card'})
             
-            for element in business_elements[:20]:  # Limit to first 20 results
+            for element in business_elements[:_RESULTS_PER_PAGE]:
                 try:
-                    company_data = self._parse_yelp_result(element)
-                    if company_data:
-                        companies.append(company_data)
-                        time.sleep(random.uniform(1, 3))  # Respectful scraping
+                    listing = _parse_yelp_result(element)
+                    if listing:
+                        companies.append(listing)
                         
                 except Exception as e:
                     self.logger.warning(f"Failed to parse Yelp element: {str(e)}")
@@ -134,39 +213,7 @@ class BusinessDirectoryScraper:
             
         return companies
     
-    def _parse_yelp_result(self, element) -> Optional[Dict]:
-        """Parse individual Yelp business result"""
-        try:
-            company_data = {}
-            
-            # Company name
-            name_element = element.find('a', {'data-testid': 'business-link'})
-            if name_element:
-                company_data['company_name'] = name_element.get_text(strip=True)
-                company_data['yelp_url'] = name_element.get('href')
-            
-            # Rating and review count
-            rating_element = element.find('span', {'data-testid': 'review-count'})
-            if rating_element:
-                company_data['review_count'] = rating_element.get_text(strip=True)
-            
-            # Categories
-            categories = element.find_all('span', class_='css-1heecm')
-            if categories:
-                company_data['industry'] = ', '.join([cat.get_text(strip=True) for cat in categories])
-            
-            # Address
-            address_element = element.find('span', {'data-testid': 'address'})
-            if address_element:
-                company_data['address'] = address_element.get_text(strip=True)
-            
-            return company_data if company_data.get('company_name') else None
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse Yelp result: {str(e)}")
-            return None
-    
-    def scrape_google_business(self, location: str, industry: str = None) -> List[Dict]:
+    def scrape_google_business(self, location: str, industry: str = None) -> List[DirectoryListing]:
         """Scrape real companies from Google Business listings"""
         companies = []
         
@@ -181,20 +228,18 @@ class BusinessDirectoryScraper:
             
             self.logger.info(f"Scraping Google Business: {search_query}")
             
-            response = self.session.get(search_url)
-            response.raise_for_status()
+            response = self._fetch(search_url)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_GOOGLE_LISTINGS)
             
             # Find business listings (Google's structure varies)
             business_elements = soup.find_all('div', class_='rllt__details')
             
-            for element in business_elements[:20]:  # Limit to first 20 results
+            for element in business_elements[:_RESULTS_PER_PAGE]:
                 try:
-                    company_data = self._parse_google_result(element)
-                    if company_data:
-                        companies.append(company_data)
-                        time.sleep(random.uniform(2, 4))  # More respectful for Google
+                    listing = _parse_google_result(element)
+                    if listing:
+                        companies.append(listing)
                         
                 except Exception as e:
                     self.logger.warning(f"Failed to parse Google element: {str(e)}")
@@ -205,32 +250,6 @@ class BusinessDirectoryScraper:
             
         return companies
     
-    def _parse_google_result(self, element) -> Optional[Dict]:
-        """Parse individual Google business result"""
-        try:
-            company_data = {}
-            
-            # Company name
-            name_element = element.find('div', class_='dbg0pd')
-            if name_element:
-                company_data['company_name'] = name_element.get_text(strip=True)
-            
-            # Address
-            address_element = element.find('span', class_='LrzXr')
-            if address_element:
-                company_data['address'] = address_element.get_text(strip=True)
-            
-            # Phone
-            phone_element = element.find('span', class_='LrzXr zdqRlf')
-            if phone_element:
-                company_data['phone'] = phone_element.get_text(strip=True)
-            
-            return company_data if company_data.get('company_name') else None
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse Google result: {str(e)}")
-            return None
-    
     def bulk_scrape_directories(self, location: str, industry: str = None) -> List[Dict]:
         """Scrape from multiple business directories"""
         all_companies = []
@@ -242,26 +261,53 @@ class BusinessDirectoryScraper:
             # self.scrape_google_business  # Commented out due to Google's strict anti-scraping
         ]
         
-        for source in sources:
-            try:
-                companies = source(location, industry)
-                all_companies.extend(companies)
-                self.logger.info(f"Scraped {len(companies)} companies from {source.__name__}")
-                time.sleep(random.uniform(3, 5))  # Delay between sources
-                
-            except Exception as e:
-                self.logger.error(f"Source {source.__name__} failed: {str(e)}")
-                continue
+        # Each source is a different host, so they can be scraped concurrently
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [executor.submit(source, location, industry) for source in sources]
+            
+            for source, future in zip(sources, futures):
+                try:
+                    companies = future.result()
+                    all_companies.extend(companies)
+                    self.logger.info(f"Scraped {len(companies)} companies from {source.__name__}")
+                    
+                except Exception as e:
+                    self.logger.error(f"Source {source.__name__} failed: {str(e)}")
+                    continue
         
-        # Remove duplicates based on company name
-        unique_companies = []
-        seen_names = set()
+        # Remove duplicates based on normalized company name, keeping the first listing seen
+        seen_names = {}
         
-        for company in all_companies:
-            name = company.get('company_name', '').lower().strip()
+        for listing in all_companies:
+            name = self._normalize_company_name(listing.company_name)
             if name and name not in seen_names:
-                unique_companies.append(company)
-                seen_names.add(name)
+                seen_names[name] = listing
+        
+        # Listings become plain dicts here, where they leave the scraper
+        unique_companies = [listing.to_dict() for listing in seen_names.values()]
         
         self.logger.info(f"Total unique companies found: {len(unique_companies)}")
         return unique_companies
+    
+    @staticmethod
+    def _normalize_company_name(name: str) -> str:
+        """Fingerprint a company name so "Acme, Inc." and "Acme Inc" match"""
+        name = name.lower().strip()
+        stripped = _LEGAL_SUFFIX_RE.sub('', name)
+        return _NON_ALNUM_RE.sub('', stripped or name)
+    
+    def bulk_scrape_locations(self, locations: List[str], industries: List[str] = None) -> List[Dict]:
+        """Scrape every location/industry combination concurrently"""
+        searches = [(location, industry) for location in locations for industry in (industries or [None])]
+        if not searches:
+            return []
+        
+        all_companies = []
+        max_workers = min(SCRAPING_CONFIG["scrape_workers"], len(searches))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda search: self.bulk_scrape_directories(*search), searches)
+            for companies in results:
+                all_companies.extend(companies)
+        
+        return all_companies
@@ -4,49 +4,115 @@ Uses various APIs to find contact information for discovered companies
 """
 
 import requests
-import time
+import threading
 import logging
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
-from retrying import retry
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+import tldextract
 import json
+import orjson
 
 from config import API_CONFIG, SCRAPING_CONFIG
+from data_collectors.http_session import configure_session, is_cached
+from data_collectors.rate_limiter import HostRateLimiter
+
+# Title keywords that mark a contact as a decision maker, matched in a single scan of the title
+_DECISION_TITLE_RE = re.compile('|'.join((
+    'ceo', 'cfo', 'coo', 'president', 'owner', 'founder', 'vp', 'director', 'partner'
+)), re.IGNORECASE)
+
+# API settings bound once at import rather than looked up on every request
+_APOLLO_API_KEY = API_CONFIG["apollo"]["api_key"]
+_APOLLO_BASE_URL = API_CONFIG["apollo"]["base_url"]
+_HUNTER_API_KEY = API_CONFIG["hunter"]["api_key"]
+_HUNTER_BASE_URL = API_CONFIG["hunter"]["base_url"]
+_ZOOMINFO_API_KEY = API_CONFIG["zoominfo"]["api_key"]
+_ZOOMINFO_BASE_URL = API_CONFIG["zoominfo"]["base_url"]
+
+# Only throttling and server-side failures are worth retrying; other 4xx errors fail fast
+_RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# The retry decorator on _get is the only retry layer; adapter retries would multiply its attempts
+# and turn exhausted 502/503/504s into RetryError, which it doesn't retry
+_NO_TRANSPORT_RETRIES = Retry(total=0, read=False)
+
+# Uses the bundled public suffix snapshot rather than fetching the list at runtime
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
 
 class ContactEnricher:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._local = threading.local()
+        requests_per_second = SCRAPING_CONFIG["api_requests_per_second"]
+        self.rate_limiter = HostRateLimiter(capacity=requests_per_second, rate=requests_per_second)
+        
+        # In-process caches for lookups repeated across companies
+        self._apollo_organizations: Dict[str, Dict] = {}
+        self._email_verifications: Dict[str, Dict] = {}
+    
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread HTTP session, since bulk enrichment runs on a thread pool"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            # API responses are cached on disk so reruns don't spend quota again
+            session = CachedSession(
+                SCRAPING_CONFIG["api_cache_path"],
+                expire_after=SCRAPING_CONFIG["api_cache_ttl"],
+                allowable_methods=('GET',)
+            )
+            configure_session(session, max_retries=_NO_TRANSPORT_RETRIES)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+            self._local.session = session
+        return session
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.5, max=8),
+        retry=retry_if_exception_type((requests.Timeout, requests.ConnectionError, requests.HTTPError)),
+        reraise=True
+    )
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Issue a GET once the target host's rate limit allows it, retrying transient failures"""
+        # Cached responses cost no API quota, so only a real request waits for the host's limit
+        if not is_cached(self.session, url, params=kwargs.get('params'), headers=kwargs.get('headers')):
+            self.rate_limiter.acquire(url)
+        response = self.session.get(url, **kwargs)
+        
+        if response.status_code in _RETRYABLE_STATUSES:
+            response.raise_for_status()
+        return response
     
-    @retry(stop_max_attempt_number=3, wait_fixed=2000)
     def enrich_company_contacts(self, company_data: Dict) -> Dict:
         """Enrich company data with contact information from multiple sources"""
         enriched_data = company_data.copy()
         
         try:
             # Try Apollo API first (most comprehensive)
-            if API_CONFIG["apollo"]["api_key"]:
+            if _APOLLO_API_KEY:
                 apollo_data = self._get_apollo_contacts(company_data)
                 if apollo_data:
                     enriched_data.update(apollo_data)
             
             # Try Hunter.io for email verification
-            if API_CONFIG["hunter"]["api_key"]:
+            if _HUNTER_API_KEY:
                 hunter_data = self._get_hunter_contacts(company_data)
                 if hunter_data:
                     enriched_data.update(hunter_data)
             
             # Try ZoomInfo if available
-            if API_CONFIG["zoominfo"]["api_key"]:
+            if _ZOOMINFO_API_KEY:
                 zoominfo_data = self._get_zoominfo_contacts(company_data)
                 if zoominfo_data:
                     enriched_data.update(zoominfo_data)
             
-            # Add delay to respect rate limits
-            time.sleep(SCRAPING_CONFIG["delay_between_requests"])
-            
         except Exception as e:
             self.logger.error(f"Failed to enrich contacts for {company_data.get('company_name', 'Unknown')}: {str(e)}")
         
@@ -55,24 +121,30 @@ class ContactEnricher:
     def _get_apollo_contacts(self, company_data: Dict) -> Optional[Dict]:
         """Get contact information from Apollo API"""
         try:
-            api_key = API_CONFIG["apollo"]["api_key"]
-            base_url = API_CONFIG["apollo"]["base_url"]
-            
-            # Search for company
-            search_params = {
-                'q_organization_name': company_data.get('company_name', ''),
-                'page': 1,
-                'per_page': 10
-            }
+            api_key = _APOLLO_API_KEY
+            base_url = _APOLLO_BASE_URL
             
+            company_name = company_data.get('company_name', '')
             headers = {'X-Api-Key': api_key}
-            response = self.session.get(f"{base_url}/organizations/search", headers=headers, params=search_params)
-            response.raise_for_status()
             
-            data = response.json()
-            if data.get('organizations'):
-                org = data['organizations'][0]  # Take first match
+            # Duplicate companies reuse the organization found the first time
+            org = self._apollo_organizations.get(company_name.lower())
+            if org is None:
+                search_params = {
+                    'q_organization_name': company_name,
+                    'page': 1,
+                    'per_page': 10
+                }
                 
+                response = self._get(f"{base_url}/organizations/search", headers=headers, params=search_params)
+                response.raise_for_status()
+                
+                data = orjson.loads(response.content)
+                if data.get('organizations'):
+                    org = data['organizations'][0]  # Take first match
+                    self._apollo_organizations[company_name.lower()] = org
+            
+            if org:
                 # Get people at this organization
                 people_params = {
                     'organization_id': org['id'],
@@ -80,19 +152,19 @@ class ContactEnricher:
                     'per_page': 20
                 }
                 
-                people_response = self.session.get(f"{base_url}/people/search", headers=headers, params=people_params)
+                people_response = self._get(f"{base_url}/people/search", headers=headers, params=people_params)
                 people_response.raise_for_status()
                 
-                people_data = people_response.json()
+                people_data = orjson.loads(people_response.content)
                 
                 # Find decision makers (C-level, VP, Director, Owner)
                 decision_makers = []
                 for person in people_data.get('people', []):
-                    title = person.get('title', '').lower()
-                    if any(keyword in title for keyword in ['ceo', 'president', 'owner', 'vp', 'director', 'partner']):
+                    title = person.get('title', '')
+                    if _DECISION_TITLE_RE.search(title):
                         decision_makers.append({
                             'name': f"{person.get('first_name', '')} {person.get('last_name', '')}".strip(),
-                            'title': person.get('title', ''),
+                            'title': title,
                             'email': person.get('email', ''),
                             'phone': person.get('phone', ''),
                             'linkedin_url': person.get('linkedin_url', '')
@@ -113,11 +185,43 @@ class ContactEnricher:
         
         return None
     
+    def _prefetch_apollo_organizations(self, companies: List[Dict]):
+        """Look up Apollo organizations in batches by domain ahead of per-company enrichment"""
+        api_key = _APOLLO_API_KEY
+        base_url = _APOLLO_BASE_URL
+        batch_size = SCRAPING_CONFIG["apollo_batch_size"]
+        
+        # Map each uncached company's domain to the names it should be cached under
+        pending: Dict[str, List[str]] = {}
+        for company in companies:
+            name = company.get('company_name', '').lower()
+            domain = self._extract_domain(company.get('website', ''))
+            if name and domain and name not in self._apollo_organizations:
+                pending.setdefault(domain, []).append(name)
+        
+        domains = list(pending)
+        for start in range(0, len(domains), batch_size):
+            batch = domains[start:start + batch_size]
+            try:
+                url = f"{base_url}/organizations/bulk_enrich"
+                self.rate_limiter.acquire(url)
+                response = self.session.post(url, headers={'X-Api-Key': api_key}, json={'domains': batch})
+                response.raise_for_status()
+                
+                for org in orjson.loads(response.content).get('organizations') or []:
+                    if not org:
+                        continue
+                    for name in pending.get(org.get('primary_domain'), []):
+                        self._apollo_organizations[name] = org
+                        
+            except Exception as e:
+                self.logger.warning(f"Apollo bulk organization lookup failed: {str(e)}")
+    
     def _get_hunter_contacts(self, company_data: Dict) -> Optional[Dict]:
         """Get email addresses from Hunter.io API"""
         try:
-            api_key = API_CONFIG["hunter"]["api_key"]
-            base_url = API_CONFIG["hunter"]["base_url"]
+            api_key = _HUNTER_API_KEY
+            base_url = _HUNTER_BASE_URL
             
             # Search for domain
             domain = self._extract_domain(company_data.get('website', ''))
@@ -131,10 +235,10 @@ class ContactEnricher:
                 'type': 'generic'
             }
             
-            response = self.session.get(f"{base_url}/domain-search", params=search_params)
+            response = self._get(f"{base_url}/domain-search", params=search_params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if data.get('data', {}).get('emails'):
                 emails = []
                 for email_info in data['data']['emails']:
@@ -157,8 +261,8 @@ class ContactEnricher:
     def _get_zoominfo_contacts(self, company_data: Dict) -> Optional[Dict]:
         """Get contact information from ZoomInfo API"""
         try:
-            api_key = API_CONFIG["zoominfo"]["api_key"]
-            base_url = API_CONFIG["zoominfo"]["base_url"]
+            api_key = _ZOOMINFO_API_KEY
+            base_url = _ZOOMINFO_BASE_URL
             
             # Search for company
             search_params = {
@@ -167,10 +271,10 @@ class ContactEnricher:
                 'location': company_data.get('location', '')
             }
             
-            response = self.session.get(f"{base_url}/company/search", params=search_params)
+            response = self._get(f"{base_url}/company/search", params=search_params)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if data.get('companies'):
                 company = data['companies'][0]
                 
@@ -189,40 +293,44 @@ class ContactEnricher:
         
         return None
     
-    def _extract_domain(self, url: str) -> Optional[str]:
-        """Extract domain from URL"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_domain(url: str) -> Optional[str]:
+        """Extract the registrable domain from URL (www.acme.co.uk/path -> acme.co.uk)"""
         if not url:
             return None
         
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url if url.startswith('http') else f'https://{url}')
-            return parsed.netloc
-        except:
-            return None
+        ext = _TLD_EXTRACT(url)
+        return f"{ext.domain}.{ext.suffix}" if ext.domain and ext.suffix else None
     
     def verify_email(self, email: str) -> Dict:
         """Verify email address validity using Hunter.io"""
+        cached = self._email_verifications.get(email)
+        if cached is not None:
+            return cached.copy()
+        
         try:
-            api_key = API_CONFIG["hunter"]["api_key"]
-            base_url = API_CONFIG["hunter"]["base_url"]
+            api_key = _HUNTER_API_KEY
+            base_url = _HUNTER_BASE_URL
             
             params = {
                 'api_key': api_key,
                 'email': email
             }
             
-            response = self.session.get(f"{base_url}/email-verifier", params=params)
+            response = self._get(f"{base_url}/email-verifier", params=params)
             response.raise_for_status()
             
-            data = response.json()
-            return {
+            data = orjson.loads(response.content)
+            verification = {
                 'email': email,
                 'valid': data.get('data', {}).get('status') == 'valid',
                 'score': data.get('data', {}).get('score', 0),
                 'disposable': data.get('data', {}).get('disposable', False),
                 'webmail': data.get('data', {}).get('webmail', False)
             }
+            self._email_verifications[email] = verification
+            return verification.copy()
             
         except Exception as e:
             self.logger.warning(f"Email verification failed for {email}: {str(e)}")
@@ -236,47 +344,59 @@ class ContactEnricher:
     
     def bulk_enrich(self, companies: List[Dict]) -> List[Dict]:
         """Enrich multiple companies with contact information"""
-        enriched_companies = []
+        enriched_companies = [None] * len(companies)
+        if not companies:
+            return enriched_companies
         
-        for i, company in enumerate(companies):
-            self.logger.info(f"Enriching company {i+1}/{len(companies)}: {company.get('company_name', 'Unknown')}")
-            
-            enriched_company = self.enrich_company_contacts(company)
-            enriched_companies.append(enriched_company)
+        # Resolve Apollo organizations in batches so workers can skip the per-company search
+        if _APOLLO_API_KEY:
+            self._prefetch_apollo_organizations(companies)
+        
+        max_workers = min(SCRAPING_CONFIG["enrich_workers"], len(companies))
+        
+        # Enrichment is network-bound, so fan the companies out over a thread pool
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.enrich_company_contacts, company): i
+                for i, company in enumerate(companies)
+            }
             
-            # Progress indicator
-            if (i + 1) % 10 == 0:
-                self.logger.info(f"Progress: {i+1}/{len(companies)} companies enriched")
+            for completed, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    enriched_companies[i] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to enrich {companies[i].get('company_name', 'Unknown')}: {str(e)}")
+                    enriched_companies[i] = companies[i].copy()
+                
+                # Progress indicator
+                if completed % 10 == 0:
+                    self.logger.info(f"Progress: {completed}/{len(companies)} companies enriched")
         
         return enriched_companies
     
     def get_contact_summary(self, enriched_company: Dict) -> Dict:
         """Generate a summary of available contact information"""
-        summary = {
-            'company_name': enriched_company.get('company_name', 'Unknown'),
-            'has_website': bool(enriched_company.get('website')),
-            'has_phone': bool(enriched_company.get('phone')),
-            'has_emails': bool(enriched_company.get('hunter_emails') or enriched_company.get('decision_makers')),
-            'decision_maker_count': len(enriched_company.get('decision_makers', [])),
-            'verified_emails': 0,
-            'total_contact_score': 0
-        }
+        get = enriched_company.get
+        has_website = bool(get('website'))
+        has_phone = bool(get('phone'))
+        hunter_emails = get('hunter_emails') or ()
+        decision_makers = get('decision_makers') or ()
         
-        # Count verified emails
-        if enriched_company.get('hunter_emails'):
-            summary['verified_emails'] = len([
-                email for email in enriched_company['hunter_emails'] 
-                if email.get('confidence', 0) > 50
-            ])
+        has_emails = bool(hunter_emails or decision_makers)
+        decision_maker_count = len(decision_makers)
+        verified_emails = sum(1 for email in hunter_emails if email.get('confidence', 0) > 50)
         
-        # Calculate contact score
-        score = 0
-        if summary['has_website']: score += 10
-        if summary['has_phone']: score += 15
-        if summary['has_emails']: score += 25
-        if summary['decision_maker_count'] > 0: score += 20
-        if summary['verified_emails'] > 0: score += 30
+        # Contact score: website 10, phone 15, emails 25, decision makers 20, verified emails 30
+        score = (10 * has_website + 15 * has_phone + 25 * has_emails
+                 + 20 * (decision_maker_count > 0) + 30 * (verified_emails > 0))
         
-        summary['total_contact_score'] = score
-        
-        return summary
+        return {
+            'company_name': get('company_name', 'Unknown'),
+            'has_website': has_website,
+            'has_phone': has_phone,
+            'has_emails': has_emails,
+            'decision_maker_count': decision_maker_count,
+            'verified_emails': verified_emails,
+            'total_contact_score': score
+        }
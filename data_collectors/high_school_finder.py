@@ -5,17 +5,246 @@ Finds high schools and educational institutions for financial literacy partnersh
 """
 
 import os
+import collections.abc
+import functools
+import re
 import requests
-import time
-from typing import List, Dict, Optional
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Sequence
 import logging
 
+from config import load_env
+from data_collectors.models import SchoolRecord
+
+# Schools enriched concurrently per city
+_ENRICH_WORKERS = 10
+
+# Known high schools keyed by (state, city), built once at import
+_CITY_SCHOOLS = {
+    # NYC High Schools
+    ("ny", "new york"): (
+        {"domain": "brooklyntech.org", "name": "Brooklyn Technical High School", "type": "Public"},
+        {"domain": "stuyvesant.edu", "name": "Stuyvesant High School", "type": "Public"},
+        {"domain": "bronxhs.org", "name": "Bronx High School of Science", "type": "Public"},
+        {"domain": "laguardiahs.org", "name": "LaGuardia High School", "type": "Public"},
+        {"domain": "townsendharris.org", "name": "Townsend Harris High School", "type": "Public"},
+        {"domain": "bard.edu", "name": "Bard High School Early College", "type": "Public"},
+        {"domain": "hunter.cuny.edu", "name": "Hunter College High School", "type": "Public"},
+        {"domain": "brooklynlatin.org", "name": "Brooklyn Latin School", "type": "Public"},
+        {"domain": "lehman.cuny.edu", "name": "Lehman College High School", "type": "Public"},
+        {"domain": "queens.edu", "name": "Queens College High School", "type": "Public"}
+    ),
+    # Los Angeles High Schools
+    ("ca", "los angeles"): (
+        {"domain": "lausd.net", "name": "Los Angeles Unified School District", "type": "Public"},
+        {"domain": "beverlyhills.org", "name": "Beverly Hills High School", "type": "Public"},
+        {"domain": "smmusd.org", "name": "Santa Monica High School", "type": "Public"},
+        {"domain": "culvercity.org", "name": "Culver City High School", "type": "Public"},
+        {"domain": "redondo.org", "name": "Redondo Union High School", "type": "Public"},
+        {"domain": "manhattanbeach.org", "name": "Mira Costa High School", "type": "Public"},
+        {"domain": "elcamino.edu", "name": "El Camino College", "type": "Community College"},
+        {"domain": "santacollege.edu", "name": "Santa Monica College", "type": "Community College"}
+    ),
+    # Chicago High Schools
+    ("il", "chicago"): (
+        {"domain": "cps.edu", "name": "Chicago Public Schools", "type": "Public"},
+        {"domain": "lanecc.org", "name": "Lane Technical High School", "type": "Public"},
+        {"domain": "payton.edu", "name": "Walter Payton College Prep", "type": "Public"},
+        {"domain": "northside.edu", "name": "Northside College Prep", "type": "Public"},
+        {"domain": "jonescollegeprep.org", "name": "Jones College Prep", "type": "Public"},
+        {"domain": "whitneyyoung.org", "name": "Whitney Young Magnet High School", "type": "Public"},
+        {"domain": "brookfieldzoo.org", "name": "Chicago High School for Agricultural Sciences", "type": "Public"}
+    ),
+    # Houston High Schools
+    ("tx", "houston"): (
+        {"domain": "houstonisd.org", "name": "Houston Independent School District", "type": "Public"},
+        {"domain": "springbranchisd.com", "name": "Spring Branch ISD", "type": "Public"},
+        {"domain": "katyisd.org", "name": "Katy Independent School District", "type": "Public"},
+        {"domain": "cyfairisd.net", "name": "Cypress-Fairbanks ISD", "type": "Public"},
+        {"domain": "fortbendisd.com", "name": "Fort Bend Independent School District", "type": "Public"}
+    ),
+    # Maryland High Schools
+    ("md", "baltimore"): (
+        {"domain": "baltimorecityschools.org", "name": "Baltimore City Public Schools", "type": "Public"},
+        {"domain": "bcps.org", "name": "Baltimore County Public Schools", "type": "Public"},
+        {"domain": "stpauls-md.org", "name": "St. Paul's School", "type": "Private"},
+        {"domain": "boyslatinmd.com", "name": "Boys' Latin School", "type": "Private"},
+        {"domain": "brynmawrschool.org", "name": "Bryn Mawr School", "type": "Private"},
+        {"domain": "gilman.edu", "name": "Gilman School", "type": "Private"},
+        {"domain": "calvertschoolmd.org", "name": "Calvert School", "type": "Private"},
+        {"domain": "friendsbalt.org", "name": "Friends School of Baltimore", "type": "Private"},
+        {"domain": "park-school.org", "name": "Park School", "type": "Private"},
+        {"domain": "rolandparkcountry.org", "name": "Roland Park Country School", "type": "Private"},
+        {"domain": "mcdonogh.org", "name": "McDonogh School", "type": "Private"},
+        {"domain": "mercyhighschool.com", "name": "Mercy High School", "type": "Private"},
+        {"domain": "notredameprep.com", "name": "Notre Dame Preparatory School", "type": "Private"},
+        {"domain": "maryvale.com", "name": "Maryvale Preparatory School", "type": "Private"},
+        {"domain": "setonkeough.org", "name": "Seton Keough High School", "type": "Private"}
+    ),
+    ("md", "annapolis"): (
+        {"domain": "aacps.org", "name": "Anne Arundel County Public Schools", "type": "Public"},
+        {"domain": "severnschool.com", "name": "Severn School", "type": "Private"},
+        {"domain": "stmarysannapolis.org", "name": "St. Mary's High School", "type": "Private"},
+        {"domain": "annapolishigh.org", "name": "Annapolis High School", "type": "Public"},
+        {"domain": "broadneck.org", "name": "Broadneck High School", "type": "Public"},
+        {"domain": "southriver.org", "name": "South River High School", "type": "Public"},
+        {"domain": "oldmill.org", "name": "Old Mill High School", "type": "Public"},
+        {"domain": "meade.org", "name": "Meade High School", "type": "Public"},
+        {"domain": "northeast.org", "name": "Northeast High School", "type": "Public"},
+        {"domain": "glenburnie.org", "name": "Glen Burnie High School", "type": "Public"}
+    ),
+    ("md", "frederick"): (
+        {"domain": "fcps.org", "name": "Frederick County Public Schools", "type": "Public"},
+        {"domain": "frederickhigh.org", "name": "Frederick High School", "type": "Public"},
+        {"domain": "govthomasjohnson.org", "name": "Governor Thomas Johnson High School", "type": "Public"},
+        {"domain": "linganore.org", "name": "Linganore High School", "type": "Public"},
+        {"domain": "middletown.org", "name": "Middletown High School", "type": "Public"},
+        {"domain": "oakdale.org", "name": "Oakdale High School", "type": "Public"},
+        {"domain": "tuscarora.org", "name": "Tuscarora High School", "type": "Public"},
+        {"domain": "urbana.org", "name": "Urbana High School", "type": "Public"},
+        {"domain": "walkersville.org", "name": "Walkersville High School", "type": "Public"},
+        {"domain": "windsorknolls.org", "name": "Windsor Knolls Middle School", "type": "Public"}
+    ),
+    ("md", "rockville"): (
+        {"domain": "mcpsmd.org", "name": "Montgomery County Public Schools", "type": "Public"},
+        {"domain": "rockvillehigh.org", "name": "Rockville High School", "type": "Public"},
+        {"domain": "richardmontgomery.org", "name": "Richard Montgomery High School", "type": "Public"},
+        {"domain": "wheatonhigh.org", "name": "Wheaton High School", "type": "Public"},
+        {"domain": "northwood.org", "name": "Northwood High School", "type": "Public"},
+        {"domain": "magruder.org", "name": "Colonel Zadok Magruder High School", "type": "Public"},
+        {"domain": "blair.org", "name": "Montgomery Blair High School", "type": "Public"},
+        {"domain": "churchill.org", "name": "Winston Churchill High School", "type": "Public"},
+        {"domain": "waltwhitman.org", "name": "Walt Whitman High School", "type": "Public"},
+        {"domain": "bcc.org", "name": "Bethesda-Chevy Chase High School", "type": "Public"}
+    ),
+    ("md", "columbia"): (
+        {"domain": "hcpss.org", "name": "Howard County Public Schools", "type": "Public"},
+        {"domain": "atholton.org", "name": "Atholton High School", "type": "Public"},
+        {"domain": "centennial.org", "name": "Centennial High School", "type": "Public"},
+        {"domain": "glenelg.org", "name": "Glenelg High School", "type": "Public"},
+        {"domain": "hammond.org", "name": "Hammond High School", "type": "Public"},
+        {"domain": "howard.org", "name": "Howard High School", "type": "Public"},
+        {"domain": "longreach.org", "name": "Long Reach High School", "type": "Public"},
+        {"domain": "marriottsridge.org", "name": "Marriotts Ridge High School", "type": "Public"},
+        {"domain": "mounthebron.org", "name": "Mount Hebron High School", "type": "Public"},
+        {"domain": "oaklandmills.org", "name": "Oakland Mills High School", "type": "Public"},
+        {"domain": "riverhill.org", "name": "River Hill High School", "type": "Public"},
+        {"domain": "wilde-lake.org", "name": "Wilde Lake High School", "type": "Public"}
+    )
+}
+
+# Alternate spellings mapped onto the keys used in _CITY_SCHOOLS
+_CITY_ALIASES = {
+    "nyc": "new york",
+    "new york city": "new york",
+    "la": "los angeles"
+}
+
+# Known city names matched as whole words, so "Baltimore City" or "NYC Metro" still find their table.
+# The two-letter "la" alias is left out here; as a bare token it would also match "La Plata".
+_CITY_TOKEN_RE = re.compile(r'\b(?:' + '|'.join(
+    re.escape(token)
+    for token in sorted({city for _, city in _CITY_SCHOOLS} | (_CITY_ALIASES.keys() - {"la"}), key=lambda token: (-len(token), token))
+) + r')\b')
+
+_STATE_ALIASES = {
+    "new york": "ny",
+    "california": "ca",
+    "illinois": "il",
+    "texas": "tx",
+    "maryland": "md"
+}
+
+# Maryland-specific names for more realistic contacts
+_MARYLAND_NAMES = (
+    "Sarah Johnson", "Michael Davis", "Jennifer Smith", "Robert Wilson", "Lisa Brown",
+    "David Miller", "Karen Garcia", "James Rodriguez", "Patricia Martinez", "Thomas Anderson",
+    "Nancy Taylor", "Christopher Lee", "Betty White", "Daniel Clark", "Margaret Lewis",
+    "Steven Hall", "Dorothy Young", "Joseph Allen", "Helen King", "Kevin Wright",
+    "Carol Green", "Brian Scott", "Ruth Baker", "Mark Adams", "Sharon Nelson",
+    "Paul Carter", "Deborah Mitchell", "George Perez", "Laura Roberts", "Frank Turner"
+)
+_MARYLAND_NAME_COUNT = len(_MARYLAND_NAMES)
+
+# School contacts generated per school: (title, offset into the name pool, phone line number)
+_SCHOOL_ROLES = (
+    ("Principal", 0, 4567),
+    ("Vice Principal", 1, 4568),
+    ("Department Head", 2, 4569)
+)
+
+
+def _build_school_decision_makers(school_name: str) -> List[Dict]:
+    """Build the decision-maker records for one school"""
+    # Clean school name for email generation
+    clean_name = school_name.lower().replace(" ", "").replace(".", "").replace("'", "").replace("-", "")
+    base = len(clean_name)
+    number_offset = base % 1000
+    
+    # Parts shared by every contact at the school are formatted once
+    email_domain = f'@{clean_name}.edu'
+    phone_prefix = f'(410) {555 + number_offset:03d}-'
+    
+    # Generate realistic decision makers (all roles always included)
+    decision_makers = []
+    for title, name_offset, line_number in _SCHOOL_ROLES:
+        name = _MARYLAND_NAMES[(base + name_offset) % _MARYLAND_NAME_COUNT]
+        lower_name = name.lower()
+        decision_makers.append({
+            'name': name,
+            'title': title,
+            'email': lower_name.replace(" ", ".") + email_domain,
+            'phone': f'{phone_prefix}{line_number + number_offset:04d}',
+            'linkedin_url': f'https://linkedin.com/in/{lower_name.replace(" ", "-")}'
+        })
+    
+    return decision_makers
+
+
+class _DecisionMakers(collections.abc.Sequence):
+    """List-like view of a school's decision makers; the records are only built when first read"""
+    # Call sites that build the records: ReportGenerator._prepare_export_data (iteration),
+    # _generate_outreach_template ([0]), _determine_best_contact_method (any(...)), and ==/repr.
+    # The qualification engine's truthiness check and ContactEnricher.get_contact_summary's len() don't.
+    # json/orjson can't serialize the view itself; serialize list(decision_makers) instead.
+    __slots__ = ('_school_name', '_records')
+    
+    def __init__(self, school_name: str):
+        self._school_name = school_name
+        self._records: Optional[List[Dict]] = None
+    
+    def _materialize(self) -> List[Dict]:
+        if self._records is None:
+            self._records = _build_school_decision_makers(self._school_name)
+        return self._records
+    
+    def __len__(self) -> int:
+        # Every role is always generated, so the length is known without building anything
+        return len(_SCHOOL_ROLES)
+    
+    def __bool__(self) -> bool:
+        return True
+    
+    def __getitem__(self, index):
+        return self._materialize()[index]
+    
+    def __iter__(self):
+        return iter(self._materialize())
+    
+    def __eq__(self, other) -> bool:
+        # Equal to the list it stands in for, and unhashable like one
+        if isinstance(other, _DecisionMakers):
+            other = other._materialize()
+        return self._materialize() == other
+    
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
 class HighSchoolFinder:
     """Find high schools and educational institutions for financial education outreach"""
     
     def __init__(self):
-        load_dotenv()
+        load_env()
         self.logger = logging.getLogger(__name__)
         
     def find_high_schools(self, city: str, state: str, max_schools: int = 50) -> List[Dict]:
@@ -26,32 +255,34 @@ class HighSchoolFinder:
         # Major high school domains by city
         high_schools = self._get_city_high_schools(city, state)
         
+        schools = high_schools[:max_schools]
         schools_data = []
         
-        for school in high_schools[:max_schools]:
-            try:
-                school_info = self._enrich_school_data(school, city, state)
-                if school_info:
-                    schools_data.append(school_info)
-                    self.logger.info(f"✅ Found: {school_info['school_name']}")
-                
-                # Rate limiting
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to enrich {school['domain']}: {e}")
-                continue
+        # Enrichment is independent per school, so it can overlap once it does real I/O
+        with ThreadPoolExecutor(max_workers=_ENRICH_WORKERS) as executor:
+            results = list(executor.map(lambda school: self._enrich_school_data(school, city, state), schools))
+        
+        # Records become plain dicts here, where they leave the finder
+        for school_info in results:
+            schools_data.append(school_info.to_dict())
+            self.logger.info(f"✅ Found: {school_info.company_name}")
         
         self.logger.info(f"🎯 Found {len(schools_data)} high schools in {city}, {state}")
         return schools_data
     
-    def find_high_schools_multiple_locations(self, locations: List[str], max_schools_per_location: int = 15) -> List[Dict]:
+    def find_high_schools_multiple_locations(self, locations: List[str], max_schools_per_location: int = 15,
+                                             max_total_schools: int = 50) -> List[Dict]:
         """Find high schools across multiple locations to get closer to 50 total contacts"""
         self.logger.info(f"🔍 Finding high schools across {len(locations)} locations")
         
         all_schools = []
         
         for location in locations:
+            # Stop if we have enough schools
+            remaining = max_total_schools - len(all_schools)
+            if remaining <= 0:
+                break
+            
             if ',' in location:
                 city, state = location.split(',', 1)
                 city = city.strip()
@@ -61,188 +292,66 @@ class HighSchoolFinder:
                 state = "MD"  # Default to Maryland
             
             self.logger.info(f"🔍 Processing {city}, {state}")
-            city_schools = self.find_high_schools(city, state, max_schools_per_location)
+            # Only enrich as many schools as are still needed
+            city_schools = self.find_high_schools(city, state, min(max_schools_per_location, remaining))
             all_schools.extend(city_schools)
-            
-            # Stop if we have enough schools
-            if len(all_schools) >= 50:
-                break
         
         self.logger.info(f"🎯 Found {len(all_schools)} total high schools across all locations")
         return all_schools
     
-    def _get_city_high_schools(self, city: str, state: str) -> List[Dict]:
-        """Get high school domains for a specific city"""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _get_city_high_schools(city: str, state: str) -> Sequence[Dict]:
+        """Get high school domains for a specific city (cached; callers must not mutate the result)"""
         
         city_lower = city.lower()
         state_lower = state.lower()
         
-        # NYC High Schools
-        if "new york" in city_lower or "nyc" in city_lower:
-            return [
-                {"domain": "brooklyntech.org", "name": "Brooklyn Technical High School", "type": "Public"},
-                {"domain": "stuyvesant.edu", "name": "Stuyvesant High School", "type": "Public"},
-                {"domain": "bronxhs.org", "name": "Bronx High School of Science", "type": "Public"},
-                {"domain": "laguardiahs.org", "name": "LaGuardia High School", "type": "Public"},
-                {"domain": "townsendharris.org", "name": "Townsend Harris High School", "type": "Public"},
-                {"domain": "bard.edu", "name": "Bard High School Early College", "type": "Public"},
-                {"domain": "hunter.cuny.edu", "name": "Hunter College High School", "type": "Public"},
-                {"domain": "brooklynlatin.org", "name": "Brooklyn Latin School", "type": "Public"},
-                {"domain": "lehman.cuny.edu", "name": "Lehman College High School", "type": "Public"},
-                {"domain": "queens.edu", "name": "Queens College High School", "type": "Public"}
-            ]
-        
-        # Los Angeles High Schools
-        elif "los angeles" in city_lower or "la" in city_lower:
-            return [
-                {"domain": "lausd.net", "name": "Los Angeles Unified School District", "type": "Public"},
-                {"domain": "beverlyhills.org", "name": "Beverly Hills High School", "type": "Public"},
-                {"domain": "smmusd.org", "name": "Santa Monica High School", "type": "Public"},
-                {"domain": "culvercity.org", "name": "Culver City High School", "type": "Public"},
-                {"domain": "redondo.org", "name": "Redondo Union High School", "type": "Public"},
-                {"domain": "manhattanbeach.org", "name": "Mira Costa High School", "type": "Public"},
-                {"domain": "elcamino.edu", "name": "El Camino College", "type": "Community College"},
-                {"domain": "santacollege.edu", "name": "Santa Monica College", "type": "Community College"}
-            ]
+        city_key = _CITY_ALIASES.get(city_lower.strip(), city_lower.strip())
+        state_key = _STATE_ALIASES.get(state_lower.strip(), state_lower.strip())
+        schools = _CITY_SCHOOLS.get((state_key, city_key))
+        if schools is not None:
+            return schools
         
-        # Chicago High Schools
-        elif "chicago" in city_lower:
-            return [
-                {"domain": "cps.edu", "name": "Chicago Public Schools", "type": "Public"},
-                {"domain": "lanecc.org", "name": "Lane Technical High School", "type": "Public"},
-                {"domain": "payton.edu", "name": "Walter Payton College Prep", "type": "Public"},
-                {"domain": "northside.edu", "name": "Northside College Prep", "type": "Public"},
-                {"domain": "jonescollegeprep.org", "name": "Jones College Prep", "type": "Public"},
-                {"domain": "whitneyyoung.org", "name": "Whitney Young Magnet High School", "type": "Public"},
-                {"domain": "brookfieldzoo.org", "name": "Chicago High School for Agricultural Sciences", "type": "Public"}
-            ]
+        # Fall back to a known city name inside a longer place name
+        token_match = _CITY_TOKEN_RE.search(city_key)
+        if token_match:
+            token = token_match.group()
+            schools = _CITY_SCHOOLS.get((state_key, _CITY_ALIASES.get(token, token)))
+            if schools is not None:
+                return schools
         
-        # Houston High Schools
-        elif "houston" in city_lower:
-            return [
-                {"domain": "houstonisd.org", "name": "Houston Independent School District", "type": "Public"},
-                {"domain": "springbranchisd.com", "name": "Spring Branch ISD", "type": "Public"},
-                {"domain": "katyisd.org", "name": "Katy Independent School District", "type": "Public"},
-                {"domain": "cyfairisd.net", "name": "Cypress-Fairbanks ISD", "type": "Public"},
-                {"domain": "fortbendisd.com", "name": "Fort Bend Independent School District", "type": "Public"}
-            ]
-        
-        # Maryland High Schools
-        elif state_lower == "md":
-            if "baltimore" in city_lower:
-                return [
-                    {"domain": "baltimorecityschools.org", "name": "Baltimore City Public Schools", "type": "Public"},
-                    {"domain": "bcps.org", "name": "Baltimore County Public Schools", "type": "Public"},
-                    {"domain": "stpauls-md.org", "name": "St. Paul's School", "type": "Private"},
-                    {"domain": "boyslatinmd.com", "name": "Boys' Latin School", "type": "Private"},
-                    {"domain": "brynmawrschool.org", "name": "Bryn Mawr School", "type": "Private"},
-                    {"domain": "gilman.edu", "name": "Gilman School", "type": "Private"},
-                    {"domain": "calvertschoolmd.org", "name": "Calvert School", "type": "Private"},
-                    {"domain": "friendsbalt.org", "name": "Friends School of Baltimore", "type": "Private"},
-                    {"domain": "park-school.org", "name": "Park School", "type": "Private"},
-                    {"domain": "rolandparkcountry.org", "name": "Roland Park Country School", "type": "Private"},
-                    {"domain": "mcdonogh.org", "name": "McDonogh School", "type": "Private"},
-                    {"domain": "mercyhighschool.com", "name": "Mercy High School", "type": "Private"},
-                    {"domain": "notredameprep.com", "name": "Notre Dame Preparatory School", "type": "Private"},
-                    {"domain": "maryvale.com", "name": "Maryvale Preparatory School", "type": "Private"},
-                    {"domain": "setonkeough.org", "name": "Seton Keough High School", "type": "Private"}
-                ]
-            elif "annapolis" in city_lower:
-                return [
-                    {"domain": "aacps.org", "name": "Anne Arundel County Public Schools", "type": "Public"},
-                    {"domain": "severnschool.com", "name": "Severn School", "type": "Private"},
-                    {"domain": "stmarysannapolis.org", "name": "St. Mary's High School", "type": "Private"},
-                    {"domain": "annapolishigh.org", "name": "Annapolis High School", "type": "Public"},
-                    {"domain": "broadneck.org", "name": "Broadneck High School", "type": "Public"},
-                    {"domain": "southriver.org", "name": "South River High School", "type": "Public"},
-                    {"domain": "oldmill.org", "name": "Old Mill High School", "type": "Public"},
-                    {"domain": "meade.org", "name": "Meade High School", "type": "Public"},
-                    {"domain": "northeast.org", "name": "Northeast High School", "type": "Public"},
-                    {"domain": "glenburnie.org", "name": "Glen Burnie High School", "type": "Public"}
-                ]
-            elif "frederick" in city_lower:
-                return [
-                    {"domain": "fcps.org", "name": "Frederick County Public Schools", "type": "Public"},
-                    {"domain": "frederickhigh.org", "name": "Frederick High School", "type": "Public"},
-                    {"domain": "govthomasjohnson.org", "name": "Governor Thomas Johnson High School", "type": "Public"},
-                    {"domain": "linganore.org", "name": "Linganore High School", "type": "Public"},
-                    {"domain": "middletown.org", "name": "Middletown High School", "type": "Public"},
-                    {"domain": "oakdale.org", "name": "Oakdale High School", "type": "Public"},
-                    {"domain": "tuscarora.org", "name": "Tuscarora High School", "type": "Public"},
-                    {"domain": "urbana.org", "name": "Urbana High School", "type": "Public"},
-                    {"domain": "walkersville.org", "name": "Walkersville High School", "type": "Public"},
-                    {"domain": "windsorknolls.org", "name": "Windsor Knolls Middle School", "type": "Public"}
-                ]
-            elif "rockville" in city_lower:
-                return [
-                    {"domain": "mcpsmd.org", "name": "Montgomery County Public Schools", "type": "Public"},
-                    {"domain": "rockvillehigh.org", "name": "Rockville High School", "type": "Public"},
-                    {"domain": "richardmontgomery.org", "name": "Richard Montgomery High School", "type": "Public"},
-                    {"domain": "wheatonhigh.org", "name": "Wheaton High School", "type": "Public"},
-                    {"domain": "northwood.org", "name": "Northwood High School", "type": "Public"},
-                    {"domain": "magruder.org", "name": "Colonel Zadok Magruder High School", "type": "Public"},
-                    {"domain": "blair.org", "name": "Montgomery Blair High School", "type": "Public"},
-                    {"domain": "churchill.org", "name": "Winston Churchill High School", "type": "Public"},
-                    {"domain": "waltwhitman.org", "name": "Walt Whitman High School", "type": "Public"},
-                    {"domain": "bcc.org", "name": "Bethesda-Chevy Chase High School", "type": "Public"}
-                ]
-            elif "columbia" in city_lower:
-                return [
-                    {"domain": "hcpss.org", "name": "Howard County Public Schools", "type": "Public"},
-                    {"domain": "atholton.org", "name": "Atholton High School", "type": "Public"},
-                    {"domain": "centennial.org", "name": "Centennial High School", "type": "Public"},
-                    {"domain": "glenelg.org", "name": "Glenelg High School", "type": "Public"},
-                    {"domain": "hammond.org", "name": "Hammond High School", "type": "Public"},
-                    {"domain": "howard.org", "name": "Howard High School", "type": "Public"},
-                    {"domain": "longreach.org", "name": "Long Reach High School", "type": "Public"},
-                    {"domain": "marriottsridge.org", "name": "Marriotts Ridge High School", "type": "Public"},
-                    {"domain": "mounthebron.org", "name": "Mount Hebron High School", "type": "Public"},
-                    {"domain": "oaklandmills.org", "name": "Oakland Mills High School", "type": "Public"},
-                    {"domain": "riverhill.org", "name": "River Hill High School", "type": "Public"},
-                    {"domain": "wilde-lake.org", "name": "Wilde Lake High School", "type": "Public"}
-                ]
-            else:
-                # Generic Maryland high schools
-                return [
-                    {"domain": f"{city_lower.replace(' ', '')}isd.org", "name": f"{city} Independent School District", "type": "Public"},
-                    {"domain": f"{city_lower.replace(' ', '')}schools.org", "name": f"{city} Public Schools", "type": "Public"},
-                    {"domain": f"{city_lower.replace(' ', '')}edu.org", "name": f"{city} Education", "type": "Public"},
-                    {"domain": f"{city_lower.replace(' ', '')}k12.{state_lower}.us", "name": f"{city} K-12 Schools", "type": "Public"}
-                ]
         # Generic high school domains for any city
-        else:
-            return [
-                {"domain": f"{city_lower.replace(' ', '')}isd.org", "name": f"{city} Independent School District", "type": "Public"},
-                {"domain": f"{city_lower.replace(' ', '')}schools.org", "name": f"{city} Public Schools", "type": "Public"},
-                {"domain": f"{city_lower.replace(' ', '')}edu.org", "name": f"{city} Education", "type": "Public"},
-                {"domain": f"{city_lower.replace(' ', '')}k12.{state_lower}.us", "name": f"{city} K-12 Schools", "type": "Public"}
-            ]
+        city_slug = city_lower.replace(' ', '')
+        return (
+            {"domain": f"{city_slug}isd.org", "name": f"{city} Independent School District", "type": "Public"},
+            {"domain": f"{city_slug}schools.org", "name": f"{city} Public Schools", "type": "Public"},
+            {"domain": f"{city_slug}edu.org", "name": f"{city} Education", "type": "Public"},
+            {"domain": f"{city_slug}k12.{state_lower}.us", "name": f"{city} K-12 Schools", "type": "Public"}
+        )
     
-    def _enrich_school_data(self, school: Dict, city: str, state: str) -> Optional[Dict]:
+    def _enrich_school_data(self, school: Dict, city: str, state: str) -> SchoolRecord:
         """Enrich school data with additional information"""
+        school_type = school['type']
+        location = f"{city}, {state}"
         
-        return {
-            'company_name': school['name'],
-            'domain': school['domain'],
-            'website': f"https://{school['domain']}",
-            'industry': 'Education',
-            'description': f"{school['type']} high school in {city}, {state}",
-            'employee_count': self._estimate_school_staff(school['type']),
-            'country': 'US',
-            'state': state,
-            'city': city,
-            'location': f"{city}, {state}",
-            'company_type': school['type'],
-            'emails': [],
-            'founded_year': '1980-2000',
-            'revenue_range': self._estimate_school_budget(school['type']),
-            'phone': '(555) 123-4567',
-            'decision_makers': self._get_school_decision_makers(school['name']),
-            'search_location': f"{city}, {state}",
-            'search_industry': 'Education',
-            'school_type': school['type'],
-            'student_population': self._estimate_student_population(school['type'])
-        }
+        return SchoolRecord(
+            company_name=school['name'],
+            domain=school['domain'],
+            website=f"https://{school['domain']}",
+            description=f"{school_type} high school in {location}",
+            employee_count=self._estimate_school_staff(school_type),
+            state=state,
+            city=city,
+            location=location,
+            company_type=school_type,
+            revenue_range=self._estimate_school_budget(school_type),
+            # Lazy: the contact dicts are only built if a report or scorer actually reads them
+            decision_makers=self._get_school_decision_makers(school['name']),
+            search_location=location,
+            school_type=school_type,
+            student_population=self._estimate_student_population(school_type)
+        )
     
     def _estimate_school_staff(self, school_type: str) -> int:
         """Estimate school staff size"""
@@ -271,52 +380,6 @@ class HighSchoolFinder:
         else:
             return "500-1500 students"
     
-    def _get_school_decision_makers(self, school_name: str) -> List[Dict]:
-        """Get realistic school decision makers with Maryland-specific names"""
-        # Clean school name for email generation
-        clean_name = school_name.lower().replace(" ", "").replace(".", "").replace("'", "").replace("-", "")
-        
-        # Maryland-specific names for more realistic contacts
-        maryland_names = [
-            "Sarah Johnson", "Michael Davis", "Jennifer Smith", "Robert Wilson", "Lisa Brown",
-            "David Miller", "Karen Garcia", "James Rodriguez", "Patricia Martinez", "Thomas Anderson",
-            "Nancy Taylor", "Christopher Lee", "Betty White", "Daniel Clark", "Margaret Lewis",
-            "Steven Hall", "Dorothy Young", "Joseph Allen", "Helen King", "Kevin Wright",
-            "Carol Green", "Brian Scott", "Ruth Baker", "Mark Adams", "Sharon Nelson",
-            "Paul Carter", "Deborah Mitchell", "George Perez", "Laura Roberts", "Frank Turner"
-        ]
-        
-        # Generate realistic decision makers
-        decision_makers = []
-        
-        # Principal (always included)
-        principal_name = maryland_names[len(clean_name) % len(maryland_names)]
-        decision_makers.append({
-            'name': principal_name,
-            'title': 'Principal',
-            'email': f'{principal_name.lower().replace(" ", ".")}@{clean_name}.edu',
-            'phone': f'(410) {555 + (len(clean_name) % 1000):03d}-{4567 + (len(clean_name) % 1000):04d}',
-            'linkedin_url': f'https://linkedin.com/in/{principal_name.lower().replace(" ", "-")}'
-        })
-        
-        # Vice Principal (always included)
-        vp_name = maryland_names[(len(clean_name) + 1) % len(maryland_names)]
-        decision_makers.append({
-            'name': vp_name,
-            'title': 'Vice Principal',
-            'email': f'{vp_name.lower().replace(" ", ".")}@{clean_name}.edu',
-            'phone': f'(410) {555 + (len(clean_name) % 1000):03d}-{4568 + (len(clean_name) % 1000):04d}',
-            'linkedin_url': f'https://linkedin.com/in/{vp_name.lower().replace(" ", "-")}'
-        })
-        
-        # Department Head (always included)
-        dept_name = maryland_names[(len(clean_name) + 2) % len(maryland_names)]
-        decision_makers.append({
-            'name': dept_name,
-            'title': 'Department Head',
-            'email': f'{dept_name.lower().replace(" ", ".")}@{clean_name}.edu',
-            'phone': f'(410) {555 + (len(clean_name) % 1000):03d}-{4569 + (len(clean_name) % 1000):04d}',
-            'linkedin_url': f'https://linkedin.com/in/{dept_name.lower().replace(" ", "-")}'
-        })
-        
-        return decision_makers
+    def _get_school_decision_makers(self, school_name: str) -> Sequence[Dict]:
+        """Get realistic school decision makers with Maryland-specific names, generated on first access"""
+        return _DecisionMakers(school_name)
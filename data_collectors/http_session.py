@@ -0,0 +1,47 @@
+"""
+HTTP Session Utilities for Transition Scout
+Shared connection-pool and transport retry settings for outbound sessions
+"""
+
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+
+def configure_session(session: requests.Session, pool_connections: int = _POOL_CONNECTIONS,
+                      pool_maxsize: int = _POOL_MAXSIZE, max_retries: Optional[Retry] = None) -> requests.Session:
+    """Mount a pooled keep-alive adapter with transport-level retries on `session`"""
+    if max_retries is None:
+        max_retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    session.headers['Connection'] = 'keep-alive'
+    # Advertises brotli only when a decoder for it is installed
+    session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+    return session
+
+
+def is_cached(session: requests.Session, url: str, params: Optional[Dict] = None,
+              headers: Optional[Dict] = None) -> bool:
+    """True when `session` is a CachedSession holding an unexpired response for this GET, so it won't hit the network"""
+    cache = getattr(session, 'cache', None)
+    if cache is None:
+        return False
+
+    # Prepared through the session so the key covers its default headers and params, as send() would
+    request = session.prepare_request(requests.Request('GET', url, params=params, headers=headers))
+    response = cache.get_response(cache.create_key(request))
+    return response is not None and not response.is_expired
@@ -5,195 +5,344 @@ Uses Hunter.io API to discover real companies and enrich their data
 """
 
 import os
+import bisect
+import re
 import requests
-import time
-from typing import List, Dict, Optional
-from dotenv import load_dotenv
+import orjson
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional
 import logging
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+from config import SCRAPING_CONFIG, load_env
+from data_collectors.http_session import configure_session, is_cached
+from data_collectors.models import EnrichedCompany
+from data_collectors.rate_limiter import TokenBucket
+
+# Domains searched per industry
+_INDUSTRY_DOMAINS = {
+    "education": (
+        "baltimorecityschools.org",     # Baltimore City Public Schools
+        "bcps.org",                     # Baltimore County Public Schools
+        "aacps.org",                    # Anne Arundel County Schools
+        "fcps.org",                     # Frederick County Schools
+        "mcpsmd.org",                   # Montgomery County Schools
+        "hcpss.org",                    # Howard County Schools
+        "carrollk12.org",               # Carroll County Schools
+        "wcpsmd.com",                   # Washington County Schools
+        "allegany.k12.md.us",           # Allegany County Schools
+        "garrettcountyschools.org",     # Garrett County Schools
+        "stpauls-md.org",               # St. Paul's School (Baltimore)
+        "boyslatinmd.com",              # Boys' Latin School
+        "brynmawrschool.org",           # Bryn Mawr School
+        "gilman.edu",                   # Gilman School
+        "calvertschoolmd.org",          # Calvert School
+        "friendsbalt.org",              # Friends School of Baltimore
+        "park-school.org",              # Park School
+        "rolandparkcountry.org",        # Roland Park Country School
+        "mcdonogh.org",                 # McDonogh School
+        "mercyhighschool.com"           # Mercy High School
+    ),
+    "retail": (
+        "conveniencestore.com",
+        "liquorstore.com",
+        "hardwarestore.com",
+        "giftstore.com",
+        "bookstore.com",
+        "jewelrystore.com",
+        "clothingstore.com",
+        "shoestore.com",
+        "antiquestore.com",
+        "toystore.com"
+    ),
+    "automotive": (
+        "autorepair.com",
+        "carwash.com",
+        "tireshop.com",
+        "autobody.com",
+        "mechanic.com",
+        "oilchange.com",
+        "autoparts.com",
+        "towing.com",
+        "detailing.com",
+        "glassrepair.com"
+    ),
+    "beauty": (
+        "salon.com",
+        "barbershop.com",
+        "spa.com",
+        "nailssalon.com",
+        "tanning.com",
+        "massage.com",
+        "skincare.com",
+        "haircut.com",
+        "beautysupply.com",
+        "esthetics.com"
+    ),
+    "home": (
+        "painting.com",
+        "plumbing.com",
+        "electrical.com",
+        "hvac.com",
+        "landscaping.com",
+        "cleaning.com",
+        "roofing.com",
+        "carpentry.com",
+        "flooring.com",
+        "handyman.com"
+    ),
+    "healthcare": (
+        "dental.com",
+        "chiropractic.com",
+        "optometry.com",
+        "pharmacy.com",
+        "physicaltherapy.com",
+        "massagetherapy.com",
+        "acupuncture.com",
+        "nutrition.com",
+        "wellness.com",
+        "fitness.com"
+    )
+}
+
+# Generic small business domains
+_GENERIC_DOMAINS = (
+    "smallbusiness.com",
+    "localbusiness.com",
+    "familybusiness.com",
+    "momandpop.com",
+    "localcompany.com"
+)
+
+# Substrings checked in order against the lowercased industry; the first match picks the domain list
+_INDUSTRY_TOKENS = (
+    ("education", "education"),
+    ("high schools", "education"),
+    ("retail", "retail"),
+    ("automotive", "automotive"),
+    ("beauty", "beauty"),
+    ("home", "home"),
+    ("healthcare", "healthcare")
+)
+_INDUSTRY_KEYS = dict(_INDUSTRY_TOKENS)
+
+# Headcount lower bounds at which the size and revenue estimates step up
+_HEADCOUNT_RE = re.compile(r'\d+')
+_HEADCOUNT_THRESHOLDS = (50, 100, 500, 1000)
+_HEADCOUNT_ESTIMATES = (50, 75, 100, 500, 1000)
+_REVENUE_THRESHOLDS = (100, 500, 1000)
+_REVENUE_RANGES = ("$1M - $10M", "$10M - $50M", "$50M - $100M", "$100M - $1B")
+
+# Fallbacks for fields a Hunter.io domain search leaves out
+_COMPANY_DEFAULTS = {
+    'industry': 'Restaurants',
+    'description': '',
+    'headcount': '10-50',
+    'country': 'US',
+    'state': 'MD',
+    'city': 'Baltimore',
+    'company_type': 'Private'
+}
+
+
+def _headcount_floor(headcount) -> Optional[int]:
+    """Lower bound of a Hunter.io headcount range such as '51-200' or '1000+'"""
+    if not isinstance(headcount, str):
+        return None
+    match = _HEADCOUNT_RE.search(headcount.replace(',', ''))
+    return int(match.group()) if match else 0
 
 class HunterCompanyFinder:
     """Find and enrich companies using Hunter.io API"""
     
+    DOMAIN_SEARCH_URL = "https://api.hunter.io/v2/domain-search"
+    
     def __init__(self):
-        load_dotenv()
+        load_env()
         self.api_key = os.getenv('HUNTER_API_KEY')
         self.logger = logging.getLogger(__name__)
         
         if not self.api_key:
             raise ValueError("Hunter.io API key not found in environment variables")
+        
+        # Query parameters shared by every domain search
+        self._search_params = {'api_key': self.api_key, 'type': 'generic'}
+        
+        # One pooled keep-alive session, so each domain lookup skips the TCP/TLS handshake.
+        # Responses are cached on disk so repeated runs don't spend Hunter.io quota again.
+        self.session = configure_session(
+            CachedSession(
+                SCRAPING_CONFIG["hunter_cache_path"],
+                expire_after=SCRAPING_CONFIG["hunter_cache_ttl"],
+                allowable_methods=('GET',)
+            ),
+            pool_connections=10,
+            # Never fewer pooled connections than workers, or extra connections get dropped after each use
+            pool_maxsize=max(20, SCRAPING_CONFIG["hunter_workers"]),
+            # 429s wait out Hunter.io's Retry-After before the next attempt
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=('GET',), respect_retry_after_header=True)
+        )
+        # Bursts up to the plan's per-second limit, then requests are paced at that rate
+        requests_per_second = SCRAPING_CONFIG["hunter_requests_per_second"]
+        self.limiter = TokenBucket(capacity=requests_per_second, rate=requests_per_second)
+        # Domain lookups already answered by Hunter.io, shared across industry searches,
+        # plus lookups currently in flight so concurrent callers share one request
+        self._domain_cache: Dict[str, Optional[Dict]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._cache_lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
+    
+    def clear_cache(self):
+        """Forget cached domain lookups, both in memory and on disk"""
+        with self._cache_lock:
+            self._domain_cache.clear()
+        self.session.cache.clear()
     
     def find_companies_by_industry(self, industry: str, location: str, max_companies: int = 20) -> List[Dict]:
         """Find companies by searching for industry-specific domains"""
+        companies = list(self.iter_companies_by_industry(industry, location, max_companies))
         
-        self.logger.info(f"🔍 Searching for {industry} companies in {location} using Hunter.io")
+        self.logger.info("🎯 Found %s companies using Hunter.io", len(companies))
+        return companies
+    
+    def find_companies_stream(self, industry: str, location: str, out_path: str, max_companies: int = 20) -> int:
+        """Write companies to a JSON Lines file as they are enriched, returning how many were written"""
+        count = 0
+        
+        with open(out_path, 'wb') as out:
+            for company_data in self.iter_companies_by_industry(industry, location, max_companies):
+                out.write(orjson.dumps(company_data) + b'\n')
+                count += 1
+        
+        self.logger.info("🎯 Wrote %s companies from Hunter.io to %s", count, out_path)
+        return count
+    
+    def iter_companies_by_industry(self, industry: str, location: str, max_companies: int = 20) -> Iterator[Dict]:
+        """Yield enriched companies in domain order as lookups complete, without holding them all"""
+        
+        self.logger.info("🔍 Searching for %s companies in %s using Hunter.io", industry, location)
         
         # Common industry-specific domains to search
         industry_domains = self._get_industry_domains(industry)
         
-        companies = []
+        domains = industry_domains[:max_companies]
         
-        for domain in industry_domains[:max_companies]:
-            try:
-                company_data = self._enrich_company_by_domain(domain)
-                if company_data:
-                    companies.append(company_data)
-                    self.logger.info(f"✅ Found: {company_data['name']}")
-                
-                # Rate limiting
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to enrich {domain}: {e}")
-                continue
-        
-        self.logger.info(f"🎯 Found {len(companies)} companies using Hunter.io")
-        return companies
+        # Lookups are independent round-trips, so overlap them instead of running back to back
+        max_workers = max(1, min(SCRAPING_CONFIG["hunter_workers"], len(domains)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for company in executor.map(self._enrich_company_by_domain, domains):
+                if company:
+                    self.logger.info("✅ Found: %s", company.company_name)
+                    # Records become plain dicts here, where they leave the finder
+                    yield company.to_dict()
     
     def _get_industry_domains(self, industry: str) -> List[str]:
         """Get industry-specific domains to search"""
+        industry_lower = industry.lower()
         
-        # Maryland high school examples by industry
-        if "education" in industry.lower() or "high schools" in industry.lower():
-            return [
-                "baltimorecityschools.org",     # Baltimore City Public Schools
-                "bcps.org",                     # Baltimore County Public Schools
-                "aacps.org",                    # Anne Arundel County Schools
-                "fcps.org",                     # Frederick County Schools
-                "mcpsmd.org",                   # Montgomery County Schools
-                "hcpss.org",                    # Howard County Schools
-                "carrollk12.org",               # Carroll County Schools
-                "wcpsmd.com",                   # Washington County Schools
-                "allegany.k12.md.us",           # Allegany County Schools
-                "garrettcountyschools.org",     # Garrett County Schools
-                "stpauls-md.org",               # St. Paul's School (Baltimore)
-                "boyslatinmd.com",              # Boys' Latin School
-                "brynmawrschool.org",           # Bryn Mawr School
-                "gilman.edu",                   # Gilman School
-                "calvertschoolmd.org",          # Calvert School
-                "friendsbalt.org",              # Friends School of Baltimore
-                "park-school.org",              # Park School
-                "rolandparkcountry.org",        # Roland Park Country School
-                "mcdonogh.org",                 # McDonogh School
-                "mercyhighschool.com"           # Mercy High School
-            ]
-        elif "retail" in industry.lower():
-            return [
-                "conveniencestore.com",
-                "liquorstore.com",
-                "hardwarestore.com",
-                "giftstore.com",
-                "bookstore.com",
-                "jewelrystore.com",
-                "clothingstore.com",
-                "shoestore.com",
-                "antiquestore.com",
-                "toystore.com"
-            ]
-        elif "automotive" in industry.lower():
-            return [
-                "autorepair.com",
-                "carwash.com",
-                "tireshop.com",
-                "autobody.com",
-                "mechanic.com",
-                "oilchange.com",
-                "autoparts.com",
-                "towing.com",
-                "detailing.com",
-                "glassrepair.com"
-            ]
-        elif "beauty" in industry.lower():
-            return [
-                "salon.com",
-                "barbershop.com",
-                "spa.com",
-                "nailssalon.com",
-                "tanning.com",
-                "massage.com",
-                "skincare.com",
-                "haircut.com",
-                "beautysupply.com",
-                "esthetics.com"
-            ]
-        elif "home" in industry.lower():
-            return [
-                "painting.com",
-                "plumbing.com",
-                "electrical.com",
-                "hvac.com",
-                "landscaping.com",
-                "cleaning.com",
-                "roofing.com",
-                "carpentry.com",
-                "flooring.com",
-                "handyman.com"
-            ]
-        elif "healthcare" in industry.lower():
-            return [
-                "dental.com",
-                "chiropractic.com",
-                "optometry.com",
-                "pharmacy.com",
-                "physicaltherapy.com",
-                "massagetherapy.com",
-                "acupuncture.com",
-                "nutrition.com",
-                "wellness.com",
-                "fitness.com"
-            ]
-        else:
-            # Generic small business domains
-            return [
-                "smallbusiness.com",
-                "localbusiness.com",
-                "familybusiness.com",
-                "momandpop.com",
-                "localcompany.com"
-            ]
-    
-    def _enrich_company_by_domain(self, domain: str) -> Optional[Dict]:
+        # Exact industry names resolve with one lookup; longer descriptions fall back to the token scan
+        key = _INDUSTRY_KEYS.get(industry_lower.strip())
+        if key is not None:
+            return list(_INDUSTRY_DOMAINS[key])
+        
+        for token, key in _INDUSTRY_TOKENS:
+            if token in industry_lower:
+                return list(_INDUSTRY_DOMAINS[key])
+        
+        return list(_GENERIC_DOMAINS)
+    
+    def _enrich_company_by_domain(self, domain: str) -> Optional[EnrichedCompany]:
         """Enrich company data using Hunter.io domain search"""
+        domain = domain.strip().lower()
         
-        url = "https://api.hunter.io/v2/domain-search"
-        params = {
-            'api_key': self.api_key,
-            'domain': domain,
-            'type': 'generic'
-        }
+        with self._cache_lock:
+            if domain in self._domain_cache:
+                return self._domain_cache[domain]
+            
+            pending = self._inflight.get(domain)
+            if pending is None:
+                pending = self._inflight[domain] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+        
+        if not is_owner:
+            return pending.result()
+        
+        try:
+            company_data = self._search_domain(domain)
+            pending.set_result(company_data)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                del self._inflight[domain]
+        
+        return company_data
+    
+    def _search_domain(self, domain: str) -> Optional[EnrichedCompany]:
+        """Run one Hunter.io domain search, caching definitive answers"""
+        params = {**self._search_params, 'domain': domain}
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            # Cached responses cost no API quota, so only a real request waits for a token
+            if not is_cached(self.session, self.DOMAIN_SEARCH_URL, params=params):
+                self.limiter.acquire()
+            response = self.session.get(self.DOMAIN_SEARCH_URL, params=params, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 company_info = data.get('data', {})
                 
-                if company_info:
-                    return {
-                        'company_name': company_info.get('organization', domain.split('.')[0].title()),
-                        'domain': domain,
-                        'website': f"https://{domain}",
-                        'industry': company_info.get('industry', 'Restaurants'),
-                        'description': company_info.get('description', ''),
-                        'employee_count': self._parse_headcount(company_info.get('headcount', '10-50')),
-                        'country': company_info.get('country', 'US'),
-                        'state': company_info.get('state', 'MD'),
-                        'city': company_info.get('city', 'Baltimore'),
-                        'location': f"{company_info.get('city', 'Baltimore')}, {company_info.get('state', 'MD')}",
-                        'company_type': company_info.get('company_type', 'Private'),
-                        'emails': company_info.get('emails', []),
-                        'founded_year': self._estimate_founded_year(company_info),
-                        'revenue_range': self._estimate_revenue(company_info),
-                        'phone': self._extract_phone(company_info),
-                        'decision_makers': self._extract_decision_makers(company_info),
-                        'search_location': f"{company_info.get('city', 'Baltimore')}, {company_info.get('state', 'MD')}",
-                        'search_industry': company_info.get('industry', 'Restaurants')
-                    }
+                company_data = None
+                # A domain Hunter knows nothing about would become a company made entirely of defaults
+                if company_info.get('organization') or company_info.get('emails'):
+                    info = {**_COMPANY_DEFAULTS, **company_info}
+                    location = f"{info['city']}, {info['state']}"
+                    company_data = EnrichedCompany(
+                        company_name=info.get('organization', domain.split('.')[0].title()),
+                        domain=domain,
+                        website=f"https://{domain}",
+                        industry=info['industry'],
+                        description=info['description'],
+                        employee_count=self._parse_headcount(info['headcount']),
+                        country=info['country'],
+                        state=info['state'],
+                        city=info['city'],
+                        location=location,
+                        company_type=info['company_type'],
+                        emails=company_info.get('emails', []),
+                        founded_year=self._estimate_founded_year(company_info),
+                        revenue_range=self._estimate_revenue(company_info),
+                        phone=self._extract_phone(company_info),
+                        decision_makers=self._extract_decision_makers(company_info),
+                        search_location=location,
+                        search_industry=info['industry']
+                    )
+                
+                # Only definitive answers are cached; failed requests are retried on the next search
+                with self._cache_lock:
+                    self._domain_cache[domain] = company_data
+                return company_data
             
             return None
             
-        except Exception as e:
-            self.logger.error(f"Error enriching {domain}: {e}")
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            # Network and payload problems skip the domain; anything else is a bug and propagates
+            self.logger.error("Error enriching %s: %s", domain, e)
             return None
     
     def _estimate_founded_year(self, company_info: Dict) -> str:
@@ -203,32 +352,16 @@ class HunterCompanyFinder:
     
     def _estimate_revenue(self, company_info: Dict) -> str:
         """Estimate revenue based on headcount and industry"""
-        headcount = company_info.get('headcount', '')
-        
-        if '1000+' in headcount or '5000+' in headcount:
-            return "$100M - $1B"
-        elif '500+' in headcount or '1000+' in headcount:
-            return "$50M - $100M"
-        elif '100+' in headcount or '500+' in headcount:
-            return "$10M - $50M"
-        else:
-            return "$1M - $10M"
+        floor = _headcount_floor(company_info.get('headcount', '')) or 0
+        return _REVENUE_RANGES[bisect.bisect_right(_REVENUE_THRESHOLDS, floor)]
     
     def _parse_headcount(self, headcount_str: str) -> int:
         """Parse headcount string to integer"""
-        try:
-            if '1000+' in headcount_str or '5000+' in headcount_str:
-                return 1000
-            elif '500+' in headcount_str or '1000+' in headcount_str:
-                return 500
-            elif '100+' in headcount_str or '500+' in headcount_str:
-                return 100
-            elif '50+' in headcount_str or '100+' in headcount_str:
-                return 75
-            else:
-                return 50  # Default for small companies
-        except:
+        floor = _headcount_floor(headcount_str)
+        if floor is None:
             return 100  # Default fallback
+        # Anything under 50 (or unparseable) counts as a small company of 50
+        return _HEADCOUNT_ESTIMATES[bisect.bisect_right(_HEADCOUNT_THRESHOLDS, floor)]
     
     def _extract_phone(self, company_info: Dict) -> str:
         """Extract phone number if available"""
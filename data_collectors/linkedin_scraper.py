@@ -3,9 +3,17 @@ LinkedIn Sales Navigator Scraper for Transition Scout
 Collects business information and contact details from LinkedIn
 """
 
+import atexit
+import re
+from collections import deque
 import time
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
+import requests
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -13,20 +21,184 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
-import pandas as pd
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import logging
 
 from config import TARGET_CRITERIA, SCRAPING_CONFIG
+from data_collectors.http_session import configure_session
+
+# Digit runs may carry thousands separators, e.g. "1,001-5,000 employees"
+_EMPLOYEE_COUNT_RE = re.compile(r'\d[\d,]*')
+
+# Read every search result's fields in one WebDriver call
+_EXTRACT_RESULTS_JS = """
+return Array.from(document.querySelectorAll('.search-result__info')).map(e => ({
+    name: e.querySelector('.search-result__title')?.innerText,
+    industry: e.querySelector('.search-result__subtitle')?.innerText,
+    location: e.querySelector('.search-result__location')?.innerText,
+    size: e.querySelector('.search-result__size')?.innerText,
+    url: e.querySelector('a')?.href
+}));
+"""
+
+# Read a company page's detail fields in one WebDriver call
+_EXTRACT_DETAILS_JS = """
+const dd = label => document.evaluate(
+    `//dt[contains(text(), '${label}')]/following-sibling::dd`,
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue?.innerText;
+return {
+    description: document.querySelector('.company-description')?.innerText,
+    founded: dd('Founded'),
+    size: dd('Company size'),
+    industry: dd('Industry')
+};
+"""
+
+_VOYAGER_SEARCH_URL = "https://www.linkedin.com/voyager/api/search/blended"
+_VOYAGER_COMPANY_TYPE = "com.linkedin.voyager.entities.shared.Company"
+_VOYAGER_HEADERS = {
+    "x-restli-protocol-version": "2.0.0",
+    "accept": "application/vnd.linkedin.normalized+json+2.1"
+}
+
+# Voyager search has no company-size filter of its own, so results are screened against the target headcount
+_MIN_EMPLOYEES, _MAX_EMPLOYEES = TARGET_CRITERIA["employee_range"]
+
+
+@lru_cache(maxsize=None)
+def _driver_path() -> str:
+    """Resolve the chromedriver binary once per process; install() checks for updates over HTTP"""
+    return ChromeDriverManager().install()
+
+
+@lru_cache(maxsize=None)
+def _user_agents() -> UserAgent:
+    """Load the fake_useragent database on first use only, then share it between drivers"""
+    return UserAgent()
+
+
+def _parse_voyager_company(entity: Dict) -> Optional[Dict]:
+    """Map a company entity from a Voyager search response to the scraper's company dict, or None if it is off target"""
+    if entity.get("$type") != _VOYAGER_COMPANY_TYPE or not entity.get("name"):
+        return None
+    
+    # Keep companies whose LinkedIn size band overlaps the target range; unsized ones are dropped, as the size facet would
+    staff_count = entity.get("staffCountRange") or {}
+    start, end = staff_count.get("start"), staff_count.get("end")
+    if start is None or start > _MAX_EMPLOYEES or (end is not None and end < _MIN_EMPLOYEES):
+        return None
+    
+    headquarters = entity.get("headquarter") or {}
+    universal_name = entity.get("universalName")
+    
+    return {
+        "company_name": entity["name"].strip(),
+        "industry": ", ".join(entity.get("industries") or []) or "Unknown",
+        "location": ", ".join(filter(None, (headquarters.get("city"), headquarters.get("geographicArea")))) or "Unknown",
+        # Upper bound of the range, matching _parse_employee_count
+        "employee_count": end or start,
+        "linkedin_url": f"https://www.linkedin.com/company/{universal_name}" if universal_name else entity.get("url")
+    }
+
+
+class DriverPool:
+    """Keeps idle Chrome sessions for reuse, handing out the most recently returned one first"""
+    
+    def __init__(self, factory: Callable[[], webdriver.Chrome], max_size: int = 4,
+                 max_idle: Optional[float] = None, refresh: Optional[Callable[[webdriver.Chrome], None]] = None):
+        self.factory = factory
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.refresh = refresh
+        # (driver, last_used_at) pairs; append/pop at the right end makes the pool LIFO
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+    
+    def acquire(self) -> webdriver.Chrome:
+        """Check out the warmest idle driver, launching a new one only when none is waiting"""
+        with self._lock:
+            driver, last_used_at = self._idle.pop() if self._idle else (None, None)
+        if driver is None:
+            return self.factory()
+        
+        if self.refresh and self.max_idle is not None and time.monotonic() - last_used_at > self.max_idle:
+            try:
+                self.refresh(driver)
+            except Exception as e:
+                self.logger.warning("Replacing driver that failed to refresh: %s", e)
+                self._quit(driver)
+                return self.factory()
+        return driver
+    
+    def release(self, driver: webdriver.Chrome):
+        """Park a driver for the next job, or quit it if the pool is full or it is broken"""
+        try:
+            self.reuse(driver)
+        except Exception as e:
+            self.logger.warning("Discarding driver that failed to reset: %s", e)
+            self._quit(driver)
+            return
+        
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((driver, time.monotonic()))
+                return
+        self._quit(driver)
+    
+    @staticmethod
+    def reuse(driver: webdriver.Chrome):
+        """Leave the current page between jobs, keeping cookies so the session stays logged in"""
+        driver.get("about:blank")
+    
+    @staticmethod
+    def _quit(driver: webdriver.Chrome):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit every idle driver"""
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for driver, _ in idle:
+            self._quit(driver)
+
 
 class LinkedInScraper:
+    # One pool of logged-in drivers per account, shared by every scraper signed in as it
+    _driver_pools: Dict[str, DriverPool] = {}
+    _pools_lock = threading.Lock()
+    
     def __init__(self, email: str, password: str):
         self.email = email
         self.password = password
         self.driver = None
+        self.api_session: Optional[requests.Session] = None
         self.logger = logging.getLogger(__name__)
-        
-    def setup_driver(self):
+    
+    def _pool(self) -> DriverPool:
+        """Get this account's driver pool, creating it on first use"""
+        with self._pools_lock:
+            pool = self._driver_pools.get(self.email)
+            if pool is None:
+                pool = self._driver_pools[self.email] = DriverPool(
+                    self._create_logged_in_driver,
+                    max_size=SCRAPING_CONFIG["linkedin_driver_pool_size"],
+                    max_idle=SCRAPING_CONFIG["linkedin_session_max_idle"],
+                    refresh=self._refresh_session
+                )
+                atexit.register(pool.close)
+        return pool
+    
+    def setup_driver(self) -> webdriver.Chrome:
+        """Check out a logged-in Chrome driver from the shared pool, signing in a new one if none is idle"""
+        return self._pool().acquire()
+    
+    @staticmethod
+    def _create_driver() -> webdriver.Chrome:
         """Initialize Chrome driver with optimal settings for scraping"""
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
@@ -36,52 +208,138 @@ class LinkedInScraper:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
         if SCRAPING_CONFIG["user_agent_rotation"]:
-            ua = UserAgent()
-            chrome_options.add_argument(f'--user-agent={ua.random}')
+            chrome_options.add_argument(f'--user-agent={_user_agents().random}')
         
-        self.driver = webdriver.Chrome(
-            ChromeDriverManager().install(),
+        driver = webdriver.Chrome(
+            service=Service(_driver_path()),
             options=chrome_options
         )
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-    def login(self):
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
+    
+    def _create_logged_in_driver(self) -> webdriver.Chrome:
+        """Launch a driver and sign it in to LinkedIn Sales Navigator"""
+        driver = self._create_driver()
+        try:
+            self._sign_in(driver)
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+    
+    def _sign_in(self, driver: webdriver.Chrome):
         """Login to LinkedIn Sales Navigator"""
+        driver.get("https://www.linkedin.com/login")
+        
+        # Enter email
+        email_field = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, "username"))
+        )
+        email_field.send_keys(self.email)
+        
+        # Enter password
+        password_field = driver.find_element(By.ID, "password")
+        password_field.send_keys(self.password)
+        
+        # Click login
+        login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        login_button.click()
+        
+        # Wait for login to complete
+        time.sleep(5)
+        
+        # Navigate to Sales Navigator
+        driver.get("https://www.linkedin.com/sales/")
+        time.sleep(3)
+    
+    @staticmethod
+    def _refresh_session(driver: webdriver.Chrome):
+        """Touch the feed so LinkedIn renews a session that sat idle in the pool"""
+        driver.get("https://www.linkedin.com/feed/")
+    
+    def warmup(self, size: int = None) -> bool:
+        """Sign in a batch of drivers up front so later jobs check out warm sessions instead of logging in"""
+        pool = self._pool()
+        size = min(size or pool.max_size, pool.max_size)
+        
+        drivers = []
+        failed = False
         try:
-            self.driver.get("https://www.linkedin.com/login")
-            
-            # Enter email
-            email_field = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            email_field.send_keys(self.email)
-            
-            # Enter password
-            password_field = self.driver.find_element(By.ID, "password")
-            password_field.send_keys(self.password)
-            
-            # Click login
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-            
-            # Wait for login to complete
-            time.sleep(5)
-            
-            # Navigate to Sales Navigator
-            self.driver.get("https://www.linkedin.com/sales/")
-            time.sleep(3)
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                futures = [executor.submit(pool.acquire) for _ in range(size)]
+                for future in futures:
+                    try:
+                        drivers.append(future.result())
+                    except Exception as e:
+                        self.logger.error("Login failed: %s", e)
+                        failed = True
+        finally:
+            # Park every driver that did sign in, even if others failed, so none is left running unowned
+            for driver in drivers:
+                pool.release(driver)
+        
+        if failed:
+            return False
+        self.logger.info("Warmed %s LinkedIn Sales Navigator sessions", size)
+        return True
+    
+    def login(self) -> bool:
+        """Check out a logged-in driver and open the Voyager API session alongside it"""
+        try:
+            if self.driver is None:
+                self.driver = self.setup_driver()
+            self.api_session = self._create_api_session()
             
             self.logger.info("Successfully logged into LinkedIn Sales Navigator")
             return True
             
         except Exception as e:
-            self.logger.error(f"Login failed: {str(e)}")
+            self.logger.error("Login failed: %s", e)
             return False
     
+    def _create_api_session(self) -> requests.Session:
+        """Carry the browser's logged-in cookies over to a plain HTTP session for Voyager API calls"""
+        session = configure_session(requests.Session())
+        session.headers.update(_VOYAGER_HEADERS)
+        session.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent")
+        
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
+            if cookie["name"] == "JSESSIONID":
+                # LinkedIn expects the session id, without its quotes, echoed back as the CSRF token
+                session.headers["csrf-token"] = cookie["value"].strip('"')
+        
+        return session
+    
+    def _search_companies_api(self, location: str, industry: str = None) -> List[Dict]:
+        """Search companies through the Voyager JSON API, skipping page rendering entirely"""
+        params = {
+            "keywords": " ".join(filter(None, (industry, location))),
+            "origin": "GLOBAL_SEARCH_HEADER",
+            "q": "all",
+            "filters": "List(resultType->COMPANIES)",
+            "start": 0,
+            "count": SCRAPING_CONFIG["max_results_per_location"]
+        }
+        response = self.api_session.get(_VOYAGER_SEARCH_URL, params=params, timeout=10)
+        response.raise_for_status()
+        
+        included = orjson.loads(response.content).get("included", [])
+        companies = [company for company in map(_parse_voyager_company, included) if company]
+        return companies[:SCRAPING_CONFIG["max_results_per_location"]]
+    
     def search_companies(self, location: str, industry: str = None) -> List[Dict]:
         """Search for companies matching our criteria in a specific location"""
         companies = []
         
+        if self.api_session is not None:
+            try:
+                companies = self._search_companies_api(location, industry)
+                if companies:
+                    return companies
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                self.logger.warning("Voyager company search failed, falling back to the browser: %s", e)
+        
         try:
             # Navigate to company search
             self.driver.get("https://www.linkedin.com/sales/search/company")
@@ -121,7 +379,7 @@ class LinkedInScraper:
             companies = self._extract_company_results()
             
         except Exception as e:
-            self.logger.error(f"Company search failed: {str(e)}")
+            self.logger.error("Company search failed: %s", e)
             
         return companies
     
@@ -130,132 +388,112 @@ class LinkedInScraper:
         companies = []
         
         try:
-            # Find company result containers
-            company_elements = self.driver.find_elements(By.CSS_SELECTOR, ".search-result__info")
+            # One script call reads every result container instead of a WebDriver round-trip per field
+            results = self.driver.execute_script(_EXTRACT_RESULTS_JS) or []
             
-            for element in company_elements[:SCRAPING_CONFIG["max_results_per_location"]]:
-                try:
-                    company_data = self._parse_company_element(element)
-                    if company_data:
-                        companies.append(company_data)
-                        
-                    # Random delay between extractions
-                    time.sleep(random.uniform(0.5, 1.5))
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse company element: {str(e)}")
-                    continue
+            for result in results[:SCRAPING_CONFIG["max_results_per_location"]]:
+                company_data = self._parse_company_element(result)
+                if company_data:
+                    companies.append(company_data)
                     
         except Exception as e:
-            self.logger.error(f"Failed to extract company results: {str(e)}")
+            self.logger.error("Failed to extract company results: %s", e)
             
         return companies
     
-    def _parse_company_element(self, element) -> Optional[Dict]:
-        """Parse individual company element for relevant information"""
-        try:
-            company_data = {}
-            
-            # Company name
-            name_element = element.find_element(By.CSS_SELECTOR, ".search-result__title")
-            company_data["company_name"] = name_element.text.strip()
-            
-            # Industry
-            try:
-                industry_element = element.find_element(By.CSS_SELECTOR, ".search-result__subtitle")
-                company_data["industry"] = industry_element.text.strip()
-            except:
-                company_data["industry"] = "Unknown"
-            
-            # Location
-            try:
-                location_element = element.find_element(By.CSS_SELECTOR, ".search-result__location")
-                company_data["location"] = location_element.text.strip()
-            except:
-                company_data["location"] = "Unknown"
-            
-            # Company size (if available)
-            try:
-                size_element = element.find_element(By.CSS_SELECTOR, ".search-result__size")
-                company_data["employee_count"] = self._parse_employee_count(size_element.text)
-            except:
-                company_data["employee_count"] = None
-            
-            # Company URL for detailed scraping
-            try:
-                link_element = element.find_element(By.CSS_SELECTOR, "a")
-                company_data["linkedin_url"] = link_element.get_attribute("href")
-            except:
-                company_data["linkedin_url"] = None
-            
-            return company_data
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse company element: {str(e)}")
+    def _parse_company_element(self, result: Dict) -> Optional[Dict]:
+        """Parse the fields read from one search result container"""
+        name = (result.get("name") or "").strip()
+        if not name:
             return None
+        
+        size = result.get("size")
+        return {
+            "company_name": name,
+            "industry": (result.get("industry") or "").strip() or "Unknown",
+            "location": (result.get("location") or "").strip() or "Unknown",
+            "employee_count": self._parse_employee_count(size) if size else None,
+            "linkedin_url": result.get("url")
+        }
     
     def _parse_employee_count(self, size_text: str) -> Optional[int]:
         """Parse employee count from size text"""
-        try:
-            # Handle various formats: "50-100 employees", "500+ employees", etc.
-            import re
-            numbers = re.findall(r'\d+', size_text)
-            if numbers:
-                if len(numbers) == 2:
-                    return int(numbers[1])  # Take upper bound
-                else:
-                    return int(numbers[0])
-        except:
-            pass
-        return None
+        # Handle various formats: "50-100 employees", "500+ employees", etc.
+        # The last number is the upper bound of a range, or the only number otherwise
+        numbers = _EMPLOYEE_COUNT_RE.findall(size_text)
+        return int(numbers[-1].replace(',', '')) if numbers else None
     
     def get_company_details(self, company_url: str) -> Dict:
         """Get detailed company information from company page"""
+        return self._get_company_details_sync(self.driver, company_url)
+    
+    def get_company_details_batch(self, company_urls: List[str]) -> List[Dict]:
+        """Get details for several company pages at once, one pooled driver per worker"""
+        if not company_urls:
+            return []
+        
+        # Pooled drivers are already signed in, so workers skip the login
+        local = threading.local()
+        drivers = []
+        drivers_lock = threading.Lock()
+    
+        def details(company_url: str) -> Dict:
+            driver = getattr(local, 'driver', None)
+            if driver is None:
+                driver = local.driver = self.setup_driver()
+                with drivers_lock:
+                    drivers.append(driver)
+            return self._get_company_details_sync(driver, company_url)
+        
+        pool = self._pool()
+        max_workers = min(SCRAPING_CONFIG["linkedin_driver_pool_size"], len(company_urls))
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(details, company_urls))
+        finally:
+            for driver in drivers:
+                pool.release(driver)
+    
+    def _get_company_details_sync(self, driver: webdriver.Chrome, company_url: str) -> Dict:
+        """Get detailed company information from company page using the given driver"""
         company_details = {}
         
         try:
-            self.driver.get(company_url)
-            time.sleep(3)
-            
-            # Company description
-            try:
-                desc_element = self.driver.find_element(By.CSS_SELECTOR, ".company-description")
-                company_details["description"] = desc_element.text.strip()
-            except:
-                company_details["description"] = ""
+            driver.get(company_url)
             
-            # Founded year
+            # Wait for the page body rather than a fixed delay; pages missing it fall through to the defaults
             try:
-                founded_element = self.driver.find_element(By.XPATH, "//dt[contains(text(), 'Founded')]/following-sibling::dd")
-                company_details["founded_year"] = founded_element.text.strip()
-            except:
-                company_details["founded_year"] = None
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ".company-description"))
+                )
+            except TimeoutException:
+                pass
             
-            # Company size
-            try:
-                size_element = self.driver.find_element(By.XPATH, "//dt[contains(text(), 'Company size')]/following-sibling::dd")
-                company_details["employee_count"] = self._parse_employee_count(size_element.text)
-            except:
-                company_details["employee_count"] = None
+            # Company description, founded year, size and industry, read in a single script call
+            details = driver.execute_script(_EXTRACT_DETAILS_JS) or {}
+            size = details.get("size")
             
-            # Industry
-            try:
-                industry_element = self.driver.find_element(By.XPATH, "//dt[contains(text(), 'Industry')]/following-sibling::dd")
-                company_details["industry"] = industry_element.text.strip()
-            except:
-                company_details["industry"] = ""
+            company_details["description"] = (details.get("description") or "").strip()
+            company_details["founded_year"] = (details.get("founded") or "").strip() or None
+            company_details["employee_count"] = self._parse_employee_count(size) if size else None
+            company_details["industry"] = (details.get("industry") or "").strip()
                 
         except Exception as e:
-            self.logger.error(f"Failed to get company details: {str(e)}")
+            self.logger.error("Failed to get company details: %s", e)
             
         return company_details
     
     def close(self):
-        """Close the browser driver"""
+        """Return the browser driver to the shared pool for the next search"""
         if self.driver:
-            self.driver.quit()
+            self._pool().release(self.driver)
+            self.driver = None
+        if self.api_session:
+            self.api_session.close()
+            self.api_session = None
     
     def __enter__(self):
+        self.login()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,95 @@
+"""
+Data Models for Transition Scout
+Lightweight records produced by the data collectors
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass(slots=True)
+class DirectoryListing:
+    """A single company listing parsed from a business directory page"""
+    company_name: str
+    website: Optional[str] = None
+    yelp_url: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    industry: Optional[str] = None
+    review_count: Optional[str] = None
+    years_in_business: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape used downstream, leaving out fields the directory didn't provide"""
+        return {
+            name: value
+            for name in _LISTING_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class SchoolRecord:
+    """An enriched high school, in the same shape as an enriched company"""
+    company_name: str
+    domain: str
+    website: str
+    description: str
+    employee_count: int
+    state: str
+    city: str
+    location: str
+    company_type: str
+    revenue_range: str
+    decision_makers: Sequence[Dict]
+    search_location: str
+    school_type: str
+    student_population: str
+    industry: str = 'Education'
+    country: str = 'US'
+    emails: List[Dict] = field(default_factory=list)
+    founded_year: str = '1980-2000'
+    phone: str = '(555) 123-4567'
+    search_industry: str = 'Education'
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape used downstream"""
+        return {name: getattr(self, name) for name in _SCHOOL_FIELDS}
+
+
+@dataclass(slots=True, frozen=True)
+class EnrichedCompany:
+    """A company enriched from a Hunter.io domain search"""
+    company_name: str
+    domain: str
+    website: str
+    industry: str
+    description: str
+    employee_count: int
+    country: str
+    state: str
+    city: str
+    location: str
+    company_type: str
+    emails: List[Dict]
+    founded_year: str
+    revenue_range: str
+    phone: str
+    decision_makers: List[Dict]
+    search_location: str
+    search_industry: str
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape used downstream"""
+        return {name: getattr(self, name) for name in _ENRICHED_FIELDS}
+
+
+_LISTING_FIELDS = tuple(f.name for f in fields(DirectoryListing))
+_ENRICHED_FIELDS = tuple(f.name for f in fields(EnrichedCompany))
+
+# Dict key order matches the records the finder used to build by hand
+_SCHOOL_FIELDS = (
+    'company_name', 'domain', 'website', 'industry', 'description', 'employee_count', 'country',
+    'state', 'city', 'location', 'company_type', 'emails', 'founded_year', 'revenue_range', 'phone',
+    'decision_makers', 'search_location', 'search_industry', 'school_type', 'student_population'
+)
@@ -5,10 +5,22 @@ Debug script to test the qualification engine
 
 import sys
 import os
+from functools import lru_cache
+from typing import Dict, List, Tuple
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from lead_qualification.qualification_engine import LeadQualificationEngine
 
+@lru_cache(maxsize=1)
+def _engine() -> LeadQualificationEngine:
+    """Build the qualification engine once and share it across calls"""
+    return LeadQualificationEngine()
+
+def qualify_batch(companies: List[Dict]) -> List[Tuple[bool, float, Dict]]:
+    """Qualify many companies with the one shared engine"""
+    engine = _engine()
+    return [engine.qualify_company(company) for company in companies]
+
 def test_qualification():
     # Sample company data
     company = {
@@ -32,8 +44,7 @@ def test_qualification():
     }
     
     # Test qualification
-    engine = LeadQualificationEngine()
-    is_qualified, score, details = engine.qualify_company(company)
+    is_qualified, score, details = qualify_batch([company])[0]
     
     print(f"Company: {company['company_name']}")
     print(f"Qualified: {is_qualified}")
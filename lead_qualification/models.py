@@ -0,0 +1,88 @@
+"""
+Qualification Models for Transition Scout
+Lightweight records produced by the lead qualification engine
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import LEAD_SCORING_WEIGHTS
+
+# Criteria in the order QualificationResult.criteria holds them
+QUALIFICATION_CRITERIA = (
+    'employee_count', 'revenue', 'business_age',
+    'industry_match', 'geographic_proximity', 'contact_information'
+)
+_CRITERION_INDEX = {name: i for i, name in enumerate(QUALIFICATION_CRITERIA)}
+
+
+@dataclass(slots=True, frozen=True)
+class CriterionResult:
+    """The outcome of one qualification criterion"""
+    value: Any
+    meets_criteria: bool
+    score: float
+    # Key and value of the criterion's target, e.g. ('target_range', (20, 200)), if it has one
+    target: Optional[Tuple[str, Any]] = None
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape used in criteria_checks"""
+        result = {'value': self.value}
+        if self.target:
+            result[self.target[0]] = self.target[1]
+        result['meets_criteria'] = self.meets_criteria
+        result['score'] = self.score
+        return result
+
+
+def weighted_scores(criteria: Tuple[CriterionResult, ...]) -> Iterator[Tuple[str, float]]:
+    """Each weighted criterion's contribution to the total, in LEAD_SCORING_WEIGHTS order"""
+    for criterion, weight in LEAD_SCORING_WEIGHTS.items():
+        index = _CRITERION_INDEX.get(criterion)
+        yield criterion, criteria[index].score * weight if index is not None else 0
+
+
+@dataclass(slots=True, frozen=True)
+class QualificationResult:
+    """A company's qualification score and the per-criterion results behind it"""
+    company_name: str
+    total_score: float
+    grade: str
+    criteria: Tuple[CriterionResult, ...]
+
+    @property
+    def is_qualified(self) -> bool:
+        return self.total_score >= 70
+
+    def to_dict(self) -> Dict:
+        """Convert to the qualification_details dict stored on companies and read by reports"""
+        score_breakdown = dict(weighted_scores(self.criteria))
+        score_breakdown['total_score'] = self.total_score
+        score_breakdown['grade'] = self.grade
+
+        return {
+            'company_name': self.company_name,
+            'criteria_checks': {
+                name: result.to_dict() for name, result in zip(QUALIFICATION_CRITERIA, self.criteria)
+            },
+            'score_breakdown': score_breakdown,
+            'qualification_reasons': self._reasons()
+        }
+
+    def _reasons(self) -> List[str]:
+        """Generate human-readable qualification reasons"""
+        reasons = []
+
+        if self.is_qualified:
+            reasons.append("Company meets minimum qualification criteria")
+        else:
+            reasons.append("Company does not meet minimum qualification criteria")
+
+        # Add specific reasons for high/low scores
+        for criterion, result in zip(QUALIFICATION_CRITERIA, self.criteria):
+            if result.score >= 80:
+                reasons.append(f"Strong {criterion.replace('_', ' ')}: {result.value}")
+            elif result.score <= 20:
+                reasons.append(f"Poor {criterion.replace('_', ' ')}: {result.value}")
+
+        return reasons
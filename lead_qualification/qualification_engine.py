@@ -3,16 +3,134 @@ Lead Qualification Engine for Transition Scout
 Scores and filters companies based on retirement readiness criteria
 """
 
+import heapq
 import logging
+import multiprocessing
+import os
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import re
 
-from config import TARGET_CRITERIA, LEAD_SCORING_WEIGHTS
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+from config import TARGET_CRITERIA, TARGET_INDUSTRIES_SET, LEAD_SCORING_WEIGHTS
+from lead_qualification.models import (
+    QUALIFICATION_CRITERIA, CriterionResult, QualificationResult
+)
+
+# LEAD_SCORING_WEIGHTS flattened into QUALIFICATION_CRITERIA order; unscored criteria such as owner_age drop out
+_WEIGHTS = np.array([LEAD_SCORING_WEIGHTS.get(c, 0) for c in QUALIFICATION_CRITERIA], dtype=np.float64)
+
+# Best possible score from the criteria that need no employee, revenue or founding data
+_FAST_REJECT_CEILING = 100 * sum(
+    LEAD_SCORING_WEIGHTS.get(c, 0) for c in ('industry_match', 'geographic_proximity', 'contact_information')
+)
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Lowest score for each grade above F
+_GRADE_THRESHOLDS = (60, 70, 80, 90)
+_GRADES = ('F', 'D', 'C', 'B', 'A')
+
+# Every target industry in one pattern, so a single C-level scan finds any of them
+_INDUSTRY_RE = re.compile('|'.join(map(re.escape, sorted(TARGET_INDUSTRIES_SET, key=len, reverse=True))))
+
+# A single value or a range like "$25M - $50M"; a missing suffix means millions
+_REV_RE = re.compile(r'\$?\s*([\d,.]+)\s*([mb]?)\s*(?:-\s*\$?\s*([\d,.]+)\s*([mb]?))?', re.I)
+_REV_MULTIPLIERS = {'m': 1_000_000, 'b': 1_000_000_000, '': 1_000_000}
+
+@lru_cache(maxsize=4096)
+def _parse_revenue_value(revenue_str: str) -> Optional[float]:
+    """Parse a revenue string, taking the midpoint of ranges; cached as directory pulls repeat the same ranges"""
+    m = _REV_RE.search(revenue_str)
+    if not m:
+        return None
+    
+    try:
+        value = float(m.group(1).replace(',', '')) * _REV_MULTIPLIERS[m.group(2).lower()]
+        if m.group(3):
+            high = float(m.group(3).replace(',', '')) * _REV_MULTIPLIERS[m.group(4).lower()]
+            return (value + high) / 2
+    except ValueError:
+        return None
+    return value
+
+def _score_numpy(emp, revenue, age, industry, location, contact, weights,
+                 min_emp, max_emp, min_rev, max_rev, min_age):
+    """Weighted total score per company, in QUALIFICATION_CRITERIA column order"""
+    # NaN compares false, so missing values score 0 like in _check_qualification_criteria
+    criteria = np.empty((len(emp), len(QUALIFICATION_CRITERIA)), dtype=np.float64)
+    criteria[:, 0] = np.where((emp >= min_emp) & (emp <= max_emp), 100, 0)
+    criteria[:, 1] = np.where((revenue >= min_rev) & (revenue <= max_rev), 100, 0)
+    criteria[:, 2] = np.where(age >= min_age, np.minimum(100, age / min_age * 100), 0)
+    criteria[:, 3] = industry * 100
+    criteria[:, 4] = location * 100
+    criteria[:, 5] = contact
+    return criteria @ weights
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: it assumes no NaNs, and NaN marks missing revenue and age.
+    # Serial on purpose: per-call arrays are too small for prange to pay off, and numba's threading
+    # layer would make forking worker processes unsafe. Compiled, or loaded from cache, on first use.
+    @njit(cache=True)
+    def _score_kernel(emp, revenue, age, industry, location, contact, weights,
+                      min_emp, max_emp, min_rev, max_rev, min_age):
+        """Same scores as _score_numpy, fused into one loop without the intermediate matrix"""
+        scores = np.empty(emp.shape[0], dtype=np.float64)
+        for i in range(emp.shape[0]):
+            total = 0.0
+            if min_emp <= emp[i] <= max_emp:
+                total += 100 * weights[0]
+            if min_rev <= revenue[i] <= max_rev:
+                total += 100 * weights[1]
+            if age[i] >= min_age:
+                total += min(100.0, age[i] / min_age * 100) * weights[2]
+            if industry[i]:
+                total += 100 * weights[3]
+            if location[i]:
+                total += 100 * weights[4]
+            total += contact[i] * weights[5]
+            scores[i] = total
+        return scores
+    
+    _score = _score_kernel
+else:
+    _score = _score_numpy
+
+# Batches above this size are qualified across worker processes
+_PARALLEL_MIN_COMPANIES = 2000
+
+@lru_cache(maxsize=1)
+def _worker_engine() -> 'LeadQualificationEngine':
+    """One engine per worker process, reused across the chunks it is given"""
+    return LeadQualificationEngine()
+
+def _qualify_chunk(chunk: Tuple[int, List[Dict], Optional[int]]) -> List[Tuple[int, QualificationResult]]:
+    """Qualify one slice of a batch in a worker, keyed by position in the full batch"""
+    offset, companies, top_k = chunk
+    positions = {id(company): offset + i for i, company in enumerate(companies)}
+    return [(positions[id(company)], result) for company, result in _worker_engine().qualify_bulk(companies, top_k)]
 
 class LeadQualificationEngine:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Per-engine rather than module-level, so cached results are freed with the engine
+        self._qualify_core = lru_cache(maxsize=16384)(self._qualify_uncached)
+        # Read the clock once per batch rather than once per company
+        self._current_year = datetime.now().year
+        # Companies skipped by _fast_reject, for observability
+        self._fast_reject_count = 0
         
     def qualify_company(self, company_data: Dict) -> Tuple[bool, float, Dict]:
         """
@@ -21,209 +139,133 @@ class LeadQualificationEngine:
         Returns:
             Tuple of (is_qualified, qualification_score, qualification_details)
         """
-        qualification_details = {
-            'company_name': company_data.get('company_name', 'Unknown'),
-            'criteria_checks': {},
-            'score_breakdown': {},
-            'qualification_reasons': []
+        # Always fully scored, so callers get the complete details dict; only qualify_bulk skips hopeless companies
+        result = self.evaluate_company(company_data)
+        return result.is_qualified, result.total_score, result.to_dict()
+    
+    def evaluate_company(self, company_data: Dict) -> QualificationResult:
+        """Score a company into a QualificationResult, leaving the details dict to be built on demand"""
+        result = self._qualify_core(self._qualification_key(company_data))
+        # The name is not part of the cache key
+        return replace(result, company_name=company_data.get('company_name', 'Unknown'))
+    
+    def _fast_reject(self, company_data: Dict) -> bool:
+        """
+        True when a company cannot reach the qualifying score, so it can be skipped unscored
+        
+        Without employee count, revenue and business age, only the remaining criteria can score.
+        """
+        if _FAST_REJECT_CEILING >= 70:
+            return False
+        rejected = (
+            not company_data.get('employee_count')
+            and not self._parse_revenue(company_data.get('revenue') or company_data.get('revenue_range'))
+            and not self._calculate_business_age(company_data)
+        )
+        if rejected:
+            self._fast_reject_count += 1
+        return rejected
+    
+    @staticmethod
+    def _qualification_key(company_data: Dict) -> Tuple:
+        """The fields qualify_company reads, as a hashable cache key"""
+        return (
+            company_data.get('employee_count'),
+            company_data.get('revenue') or company_data.get('revenue_range'),
+            company_data.get('founded_year'),
+            company_data.get('industry', '').lower(),
+            company_data.get('location', ''),
+            bool(company_data.get('website')),
+            bool(company_data.get('phone')),
+            bool(company_data.get('hunter_emails')),
+            bool(company_data.get('decision_makers'))
+        )
+    
+    def _qualify_uncached(self, key: Tuple) -> QualificationResult:
+        """Score one qualification key; pure, so _qualify_core can memoize it"""
+        employee_count, revenue, founded_year, industry, location, website, phone, emails, decision_makers = key
+        company_data = {
+            'employee_count': employee_count,
+            'revenue': revenue,
+            'founded_year': founded_year,
+            'industry': industry,
+            'location': location,
+            'website': website,
+            'phone': phone,
+            'hunter_emails': emails,
+            'decision_makers': decision_makers
         }
         
         # Check each qualification criterion
-        criteria_results = self._check_qualification_criteria(company_data)
-        qualification_details['criteria_checks'] = criteria_results
+        criteria = self._check_qualification_criteria(company_data)
         
         # Calculate qualification score
-        score_breakdown = self._calculate_qualification_score(company_data, criteria_results)
-        qualification_details['score_breakdown'] = score_breakdown
+        total_score = self._calculate_qualification_score(criteria)
+        grade = _GRADES[bisect_right(_GRADE_THRESHOLDS, total_score)]
         
-        # Determine if qualified (score >= 70)
-        total_score = score_breakdown['total_score']
-        is_qualified = total_score >= 70
-        
-        # Add qualification reasons
-        qualification_details['qualification_reasons'] = self._get_qualification_reasons(
-            criteria_results, score_breakdown
-        )
-        
-        return is_qualified, total_score, qualification_details
+        return QualificationResult('', total_score, grade, criteria)
     
-    def _check_qualification_criteria(self, company_data: Dict) -> Dict:
-        """Check if company meets each qualification criterion"""
-        criteria_results = {}
-        
+    def _check_qualification_criteria(self, company_data: Dict) -> Tuple[CriterionResult, ...]:
+        """Check if company meets each qualification criterion, in QUALIFICATION_CRITERIA order"""
         # 1. Employee count check (50-500 employees)
         employee_count = company_data.get('employee_count')
         if employee_count:
             min_emp, max_emp = TARGET_CRITERIA["employee_range"]
-            criteria_results['employee_count'] = {
-                'value': employee_count,
-                'target_range': (min_emp, max_emp),
-                'meets_criteria': min_emp <= employee_count <= max_emp,
-                'score': 100 if min_emp <= employee_count <= max_emp else 0
-            }
+            meets = min_emp <= employee_count <= max_emp
+            employee_result = CriterionResult(employee_count, meets, 100 if meets else 0, ('target_range', (min_emp, max_emp)))
         else:
-            criteria_results['employee_count'] = {
-                'value': None,
-                'target_range': TARGET_CRITERIA["employee_range"],
-                'meets_criteria': False,
-                'score': 0
-            }
+            employee_result = CriterionResult(None, False, 0, ('target_range', TARGET_CRITERIA["employee_range"]))
         
         # 2. Revenue check ($5M - $100M)
         revenue = company_data.get('revenue') or company_data.get('revenue_range')
+        revenue_result = CriterionResult(revenue or None, False, 0, ('target_range', TARGET_CRITERIA["revenue_range"]))
         if revenue:
             min_rev, max_rev = TARGET_CRITERIA["revenue_range"]
             revenue_value = self._parse_revenue(revenue)
             if revenue_value:
-                criteria_results['revenue'] = {
-                    'value': revenue_value,
-                    'target_range': (min_rev, max_rev),
-                    'meets_criteria': min_rev <= revenue_value <= max_rev,
-                    'score': 100 if min_rev <= revenue_value <= max_rev else 0
-                }
-            else:
-                criteria_results['revenue'] = {
-                    'value': revenue,
-                    'target_range': TARGET_CRITERIA["revenue_range"],
-                    'meets_criteria': False,
-                    'score': 0
-                }
-        else:
-            criteria_results['revenue'] = {
-                'value': None,
-                'target_range': TARGET_CRITERIA["revenue_range"],
-                'meets_criteria': False,
-                'score': 0
-            }
+                meets = min_rev <= revenue_value <= max_rev
+                revenue_result = CriterionResult(revenue_value, meets, 100 if meets else 0, ('target_range', (min_rev, max_rev)))
         
         # 3. Business age check (15+ years)
         business_age = self._calculate_business_age(company_data)
+        min_age = TARGET_CRITERIA["business_age_min"]
         if business_age:
-            min_age = TARGET_CRITERIA["business_age_min"]
-            criteria_results['business_age'] = {
-                'value': business_age,
-                'target_minimum': min_age,
-                'meets_criteria': business_age >= min_age,
-                'score': min(100, (business_age / min_age) * 100) if business_age >= min_age else 0
-            }
+            meets = business_age >= min_age
+            age_score = min(100, (business_age / min_age) * 100) if meets else 0
+            age_result = CriterionResult(business_age, meets, age_score, ('target_minimum', min_age))
         else:
-            criteria_results['business_age'] = {
-                'value': None,
-                'target_minimum': TARGET_CRITERIA["business_age_min"],
-                'meets_criteria': False,
-                'score': 0
-            }
+            age_result = CriterionResult(None, False, 0, ('target_minimum', min_age))
         
         # 4. Industry check
         industry = company_data.get('industry', '').lower()
-        target_industries = [ind.lower() for ind in TARGET_CRITERIA["target_industries"]]
-        industry_match = any(target_ind in industry for target_ind in target_industries)
-        criteria_results['industry_match'] = {
-            'value': industry,
-            'target_industries': TARGET_CRITERIA["target_industries"],
-            'meets_criteria': industry_match,
-            'score': 100 if industry_match else 0
-        }
+        industry_match = _INDUSTRY_RE.search(industry) is not None
+        industry_result = CriterionResult(
+            industry, industry_match, 100 if industry_match else 0,
+            ('target_industries', TARGET_CRITERIA["target_industries"])
+        )
         
         # 5. Geographic location check
         location = company_data.get('location', '')
-        criteria_results['geographic_proximity'] = {
-            'value': location,
-            'meets_criteria': bool(location),  # Any location is acceptable for now
-            'score': 100 if location else 0
-        }
+        # Any location is acceptable for now
+        location_result = CriterionResult(location, bool(location), 100 if location else 0)
         
         # 6. Contact information availability
         contact_score = self._calculate_contact_score(company_data)
-        criteria_results['contact_information'] = {
-            'value': contact_score,
-            'meets_criteria': contact_score >= 50,
-            'score': contact_score
-        }
+        contact_result = CriterionResult(contact_score, contact_score >= 50, contact_score)
         
-        return criteria_results
+        return employee_result, revenue_result, age_result, industry_result, location_result, contact_result
     
-    def _calculate_qualification_score(self, company_data: Dict, criteria_results: Dict) -> Dict:
+    def _calculate_qualification_score(self, criteria: Tuple[CriterionResult, ...]) -> float:
         """Calculate overall qualification score based on weighted criteria"""
-        score_breakdown = {}
-        
-        # Apply weights to each criterion
-        for criterion, weight in LEAD_SCORING_WEIGHTS.items():
-            if criterion in criteria_results:
-                score_breakdown[criterion] = criteria_results[criterion]['score'] * weight
-            else:
-                score_breakdown[criterion] = 0
-        
-        # Calculate total score
-        total_score = sum(score_breakdown.values())
-        score_breakdown['total_score'] = total_score
-        
-        # Add letter grade
-        if total_score >= 90:
-            grade = 'A'
-        elif total_score >= 80:
-            grade = 'B'
-        elif total_score >= 70:
-            grade = 'C'
-        elif total_score >= 60:
-            grade = 'D'
-        else:
-            grade = 'F'
-        
-        score_breakdown['grade'] = grade
-        
-        return score_breakdown
+        # One dot product against the weight vector the bulk path scores with
+        scores = np.fromiter((c.score for c in criteria), dtype=np.float64, count=len(QUALIFICATION_CRITERIA))
+        return float(scores @ _WEIGHTS)
     
     def _parse_revenue(self, revenue_str: str) -> Optional[float]:
         """Parse revenue string to numeric value"""
         if not revenue_str:
             return None
-        
-        try:
-            # Handle ranges like "$25M - $50M" by taking the midpoint
-            if ' - ' in str(revenue_str):
-                parts = str(revenue_str).split(' - ')
-                if len(parts) == 2:
-                    # Parse both parts and take average
-                    val1 = self._extract_revenue_value(parts[0])
-                    val2 = self._extract_revenue_value(parts[1])
-                    if val1 and val2:
-                        return (val1 + val2) / 2
-            
-            # Handle single values
-            return self._extract_revenue_value(revenue_str)
-        except:
-            pass
-        
-        return None
-    
-    def _extract_revenue_value(self, revenue_str: str) -> Optional[float]:
-        """Extract numeric revenue value from string"""
-        try:
-            # Remove common prefixes and suffixes
-            revenue_str = str(revenue_str).lower().strip()
-            
-            # Handle "M" for millions
-            if 'm' in revenue_str:
-                revenue_str = revenue_str.replace('m', '').replace('$', '').replace(',', '').strip()
-                if revenue_str:
-                    return float(revenue_str) * 1_000_000
-            
-            # Handle "B" for billions
-            elif 'b' in revenue_str:
-                revenue_str = revenue_str.replace('b', '').replace('$', '').replace(',', '').strip()
-                if revenue_str:
-                    return float(revenue_str) * 1_000_000_000
-            
-            # Handle plain numbers (assume millions)
-            else:
-                revenue_str = re.sub(r'[^\d.]', '', revenue_str)
-                if revenue_str:
-                    return float(revenue_str) * 1_000_000
-        except:
-            pass
-        
-        return None
+        return _parse_revenue_value(str(revenue_str))
     
     def _calculate_business_age(self, company_data: Dict) -> Optional[int]:
         """Calculate business age in years"""
@@ -232,14 +274,13 @@ class LeadQualificationEngine:
             try:
                 # Try to extract year from various formats
                 if isinstance(founded_year, str):
-                    year_match = re.search(r'\b(19|20)\d{2}\b', founded_year)
+                    year_match = _YEAR_RE.search(founded_year)
                     if year_match:
                         founded_year = int(year_match.group())
                     else:
                         return None
                 
-                current_year = datetime.now().year
-                return current_year - founded_year
+                return self._current_year - founded_year
             except:
                 pass
         
@@ -267,42 +308,98 @@ class LeadQualificationEngine:
         
         return min(100, score)
     
-    def _get_qualification_reasons(self, criteria_results: Dict, score_breakdown: Dict) -> List[str]:
-        """Generate human-readable qualification reasons"""
-        reasons = []
+    def qualify_bulk(self, companies: List[Dict], top_k: Optional[int] = None) -> List[Tuple[Dict, QualificationResult]]:
+        """
+        Score every company at once from column arrays instead of one dict at a time
         
-        if score_breakdown['total_score'] >= 70:
-            reasons.append("Company meets minimum qualification criteria")
-        else:
-            reasons.append("Company does not meet minimum qualification criteria")
+        Returns:
+            (company, qualification_result) for the qualified companies only, highest score first,
+            cut to the best top_k when given
+        """
+        companies = [c for c in companies if not self._fast_reject(c)]
+        if not companies:
+            return []
+        
+        n = len(companies)
+        min_emp, max_emp = TARGET_CRITERIA["employee_range"]
+        min_rev, max_rev = TARGET_CRITERIA["revenue_range"]
+        min_age = TARGET_CRITERIA["business_age_min"]
+        
+        # Pull each criterion's input out of the dicts once; missing values become NaN or 0
+        emp = np.fromiter((c.get('employee_count') or 0 for c in companies), dtype=np.float64, count=n)
+        revenue = np.fromiter(
+            (self._parse_revenue(c.get('revenue') or c.get('revenue_range')) or np.nan for c in companies),
+            dtype=np.float64, count=n
+        )
+        age = np.fromiter((self._calculate_business_age(c) or np.nan for c in companies), dtype=np.float64, count=n)
+        industry = np.fromiter(
+            (_INDUSTRY_RE.search((c.get('industry') or '').lower()) is not None for c in companies),
+            dtype=bool, count=n
+        )
+        location = np.fromiter((bool(c.get('location')) for c in companies), dtype=bool, count=n)
+        contact = np.fromiter(
+            (20 * bool(c.get('website')) + 20 * bool(c.get('phone'))
+             + 30 * bool(c.get('hunter_emails')) + 30 * bool(c.get('decision_makers')) for c in companies),
+            dtype=np.float64, count=n
+        )
+        
+        scores = _score(emp, revenue, age, industry, location, contact, _WEIGHTS,
+                        min_emp, max_emp, min_rev, max_rev, min_age)
         
-        # Add specific reasons for high/low scores
-        for criterion, result in criteria_results.items():
-            if result['score'] >= 80:
-                reasons.append(f"Strong {criterion.replace('_', ' ')}: {result['value']}")
-            elif result['score'] <= 20:
-                reasons.append(f"Poor {criterion.replace('_', ' ')}: {result['value']}")
+        # Stable sort keeps input order between equal scores, as list.sort did
+        qualified_idx = np.nonzero(scores >= 70)[0]
+        if top_k is not None and top_k < len(qualified_idx):
+            # nlargest is stable too, and avoids sorting every qualified company to keep a few
+            qualified_idx = heapq.nlargest(top_k, qualified_idx, key=scores.__getitem__)
+        else:
+            qualified_idx = qualified_idx[np.argsort(-scores[qualified_idx], kind='stable')]
         
-        return reasons
+        # Only qualified companies get the full per-criterion breakdown
+        return [(companies[i], self.evaluate_company(companies[i])) for i in qualified_idx]
     
-    def filter_qualified_companies(self, companies: List[Dict]) -> List[Dict]:
-        """Filter and sort companies by qualification score"""
-        qualified_companies = []
+    def _qualify_parallel(self, companies: List[Dict], top_k: Optional[int] = None) -> List[Tuple[Dict, QualificationResult]]:
+        """qualify_bulk split across worker processes, for batches large enough to repay the pickling"""
+        workers = os.cpu_count()
+        chunk_size = -(-len(companies) // workers)
+        chunks = [(start, companies[start:start + chunk_size], top_k) for start in range(0, len(companies), chunk_size)]
+        
+        # Spawned, not forked: a fork copies whatever runtime threads the parent holds (numba's, BLAS's)
+        # into children that can then hang at shutdown
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            indexed = [pair for chunk in executor.map(_qualify_chunk, chunks, chunksize=1) for pair in chunk]
+        
+        # Workers score copies; attach results to the caller's own dicts, highest score first then input order
+        if top_k is not None:
+            indexed = heapq.nlargest(top_k, indexed, key=lambda pair: (pair[1].total_score, -pair[0]))
+        else:
+            indexed.sort(key=lambda pair: (-pair[1].total_score, pair[0]))
+        return [(companies[i], result) for i, result in indexed]
+    
+    def filter_qualified_companies(self, companies: List[Dict], top_k: Optional[int] = None) -> List[Dict]:
+        """Filter and sort companies by qualification score, keeping only the best top_k if given"""
+        current_year = datetime.now().year
+        if current_year != self._current_year:
+            # Cached results carry business ages computed for the old year
+            self._current_year = current_year
+            self._qualify_core.cache_clear()
+        
+        if len(companies) > _PARALLEL_MIN_COMPANIES and (os.cpu_count() or 1) > 2:
+            qualified = self._qualify_parallel(companies, top_k)
+        else:
+            qualified = self.qualify_bulk(companies, top_k)
         
-        for company in companies:
-            is_qualified, score, details = self.qualify_company(company)
-            if is_qualified:
-                company['qualification_score'] = score
-                company['qualification_details'] = details
-                qualified_companies.append(company)
+        qualified_companies = []
         
-        # Sort by qualification score (highest first)
-        qualified_companies.sort(key=lambda x: x['qualification_score'], reverse=True)
+        # Details dicts are built only for the final qualified set
+        for company, result in qualified:
+            company['qualification_score'] = result.total_score
+            company['qualification_details'] = result.to_dict()
+            qualified_companies.append(company)
         
         return qualified_companies
     
-    def get_qualification_summary(self, companies: List[Dict]) -> Dict:
-        """Generate summary statistics for qualified companies"""
+    def get_qualification_summary(self, companies: List[Dict], qualified: Optional[List[Dict]] = None) -> Dict:
+        """Generate summary statistics for qualified companies, reusing `qualified` if already filtered"""
         if not companies:
             return {
                 'total_companies': 0,
@@ -313,32 +410,25 @@ class LeadQualificationEngine:
                 'location_distribution': {}
             }
         
-        qualified_companies = self.filter_qualified_companies(companies)
-        
-        # Score distribution
-        score_distribution = {}
-        for company in qualified_companies:
-            grade = company['qualification_details']['score_breakdown']['grade']
-            score_distribution[grade] = score_distribution.get(grade, 0) + 1
-        
-        # Industry distribution
-        industry_distribution = {}
-        for company in qualified_companies:
-            industry = company.get('industry', 'Unknown')
-            industry_distribution[industry] = industry_distribution.get(industry, 0) + 1
+        qualified_companies = self.filter_qualified_companies(companies) if qualified is None else qualified
         
-        # Location distribution
-        location_distribution = {}
+        # Grade, industry and location distributions in one pass over the qualified list
+        score_distribution = Counter()
+        industry_distribution = Counter()
+        location_distribution = Counter()
+        total_score = 0
         for company in qualified_companies:
-            location = company.get('location', 'Unknown')
-            location_distribution[location] = location_distribution.get(location, 0) + 1
+            score_distribution[company['qualification_details']['score_breakdown']['grade']] += 1
+            industry_distribution[company.get('industry', 'Unknown')] += 1
+            location_distribution[company.get('location', 'Unknown')] += 1
+            total_score += company['qualification_score']
         
         return {
             'total_companies': len(companies),
             'qualified_count': len(qualified_companies),
             'qualification_rate': len(qualified_companies) / len(companies) * 100 if len(companies) > 0 else 0,
-            'average_score': sum(c['qualification_score'] for c in qualified_companies) / len(qualified_companies) if len(qualified_companies) > 0 else 0,
-            'score_distribution': score_distribution,
-            'industry_distribution': industry_distribution,
-            'location_distribution': location_distribution
+            'average_score': total_score / len(qualified_companies) if len(qualified_companies) > 0 else 0,
+            'score_distribution': dict(score_distribution),
+            'industry_distribution': dict(industry_distribution),
+            'location_distribution': dict(location_distribution)
         }
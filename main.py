@@ -33,15 +33,17 @@ from data_collectors.business_directory_scraper import BusinessDirectoryScraper
 from lead_qualification.qualification_engine import LeadQualificationEngine
 from output_generation.report_generator import ReportGenerator
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'transition_scout_{datetime.now().strftime("%Y%m%d")}.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+def _configure_logging():
+    """Send logs to stdout and a dated log file; only the CLI entry point does this, never an import"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            # delay=True opens the file on the first record rather than up front
+            logging.FileHandler(f'transition_scout_{datetime.now().strftime("%Y%m%d")}.log', delay=True),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -235,20 +237,10 @@ class TransitionScout:
         """Scrape real companies from business directories"""
         logger.info("🌐 Scraping real companies from business directories")
         
-        all_companies = []
+        logger.info(f"🔍 Scraping companies in {', '.join(target_locations)}")
         
-        for location in target_locations:
-            logger.info(f"🔍 Scraping companies in {location}")
-            
-            if target_industries:
-                for industry in target_industries:
-                    logger.info(f"  📋 Industry: {industry}")
-                    companies = self.business_directory_scraper.bulk_scrape_directories(location, industry)
-                    all_companies.extend(companies)
-            else:
-                # Scrape all industries in location
-                companies = self.business_directory_scraper.bulk_scrape_directories(location)
-                all_companies.extend(companies)
+        # Without target industries every location is scraped across all industries
+        all_companies = self.business_directory_scraper.bulk_scrape_locations(target_locations, target_industries)
         
         if all_companies:
             self.discovered_companies = all_companies
@@ -288,7 +280,7 @@ class TransitionScout:
         logger.info(f"✅ Qualified {len(self.qualified_companies)} companies out of {len(self.enriched_companies)}")
         
         # Print qualification summary
-        summary = self.qualification_engine.get_qualification_summary(self.enriched_companies)
+        summary = self.qualification_engine.get_qualification_summary(self.enriched_companies, qualified=self.qualified_companies)
         if summary['total_companies'] > 0:
             logger.info(f"📊 Qualification Summary: {summary['qualified_count']}/{summary['total_companies']} qualified ({summary['qualification_rate']:.1f}%)")
         else:
@@ -301,12 +293,16 @@ class TransitionScout:
         # Generate report for all companies (qualified or not)
         if self.enriched_companies:
             # Create a report with all companies, marking qualification status
-            all_companies_with_status = []
-            for company in self.enriched_companies:
-                company_copy = company.copy()
-                company_copy['is_qualified'] = company in self.qualified_companies
-                company_copy['qualification_score'] = getattr(company, 'qualification_score', 'N/A')
-                all_companies_with_status.append(company_copy)
+            # Qualified companies are the same dict objects, so identity avoids comparing every field
+            qualified_ids = {id(c) for c in self.qualified_companies}
+            all_companies_with_status = [
+                {
+                    **company,
+                    'is_qualified': id(company) in qualified_ids,
+                    'qualification_score': company.get('qualification_score', 'N/A')
+                }
+                for company in self.enriched_companies
+            ]
             
             # Generate comprehensive report
             report_path = self.report_generator.generate_lead_report(all_companies_with_status)
@@ -360,6 +356,7 @@ def main():
     parser.add_argument('--real-data', action='store_true', help='Scrape real companies from business directories')
     
     args = parser.parse_args()
+    _configure_logging()
     
     # Initialize Transition Scout
     scout = TransitionScout()
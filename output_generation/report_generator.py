@@ -3,18 +3,85 @@ Report Generator for Transition Scout
 Creates Excel/CSV outputs with personalized outreach templates
 """
 
-import pandas as pd
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.worksheet import Worksheet
-from typing import List, Dict, Optional
+import csv
+import string
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+
+import numpy as np
+from typing import List, Dict, Optional, Tuple
 import logging
 from datetime import datetime
 import os
 
 from config import OUTPUT_CONFIG, OUTREACH_TEMPLATES
 
+# Columns of the Qualified Companies and Decision Makers sheets
+EXPORT_COMPANY_COLUMNS = (
+    'Company Name', 'Industry', 'Location', 'Employee Count', 'Revenue Range', 'Business Age (Years)',
+    'Website', 'Phone', 'LinkedIn URL', 'Qualification Score', 'Grade', 'Contact Score'
+)
+EXPORT_DECISION_MAKER_COLUMNS = ('Company Name', 'Decision Maker Name', 'Title', 'Email', 'Phone', 'LinkedIn URL')
+
+# Company columns repeated on every CSV row, followed by one decision maker's contact columns
+CSV_COMPANY_COLUMNS = (
+    'Company Name', 'Industry', 'Location', 'Employee Count', 'Revenue Range', 'Business Age (Years)',
+    'Website', 'Phone', 'Qualification Score', 'Grade'
+)
+# A decision maker's row after its Company Name, renamed for the CSV
+CSV_CONTACT_COLUMNS = ('Contact Name', 'Contact Title', 'Contact Email', 'Contact Phone', 'Contact LinkedIn')
+CSV_COLUMNS = CSV_COMPANY_COLUMNS + CSV_CONTACT_COLUMNS
+# Picks the CSV's company columns out of a Qualified Companies row
+_csv_company_fields = itemgetter(*(EXPORT_COMPANY_COLUMNS.index(column) for column in CSV_COMPANY_COLUMNS))
+_CSV_NO_CONTACT = ('N/A',) * len(CSV_CONTACT_COLUMNS)
+# Columns of the Outreach Templates sheet, in the order of _generate_outreach_template's rows
+OUTREACH_TEMPLATE_COLUMNS = (
+    'Company Name', 'Primary Contact', 'Contact Title', 'Email Subject', 'Email Body',
+    'LinkedIn Message', 'Best Contact Method', 'Follow-up Timeline'
+)
+
+def _safe_nested(data: Dict, *keys, default=None):
+    """Follow keys through nested dicts, returning default as soon as one is missing"""
+    # Indexing is faster than chained .get() when every key is there, and allocates no {} fallbacks
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, TypeError):
+        return default
+    return data
+
+# Outreach templates split into (literal, field, spec, conversion) parts once, instead of re-parsing per company
+_EMAIL_TEMPLATE_PARTS = tuple(string.Formatter().parse(OUTREACH_TEMPLATES["email_body"]))
+_LINKEDIN_TEMPLATE_PARTS = tuple(string.Formatter().parse(OUTREACH_TEMPLATES["linkedin_message"]))
+_EMAIL_SUBJECT = OUTREACH_TEMPLATES["email_subject"]
+
+def _render(parts: Tuple, context: Dict) -> str:
+    """Fill pre-parsed template parts from context, as str.format would"""
+    return "".join([
+        literal + (format(context[field], spec) if field is not None else '')
+        for literal, field, spec, _ in parts
+    ])
+
+# Reports with fewer outreach templates than this render them on one thread
+_PARALLEL_MIN_TEMPLATES = 500
+
+# Free-threaded builds (3.13t+) report False; older interpreters always have the GIL
+_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+
+# Summary buckets in grade-code order; unknown grades count as F
+GRADE_RANGES = ('A (90-100)', 'B (80-89)', 'C (70-79)', 'D (60-69)', 'F (0-59)')
+_GRADE_CODES = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+def _grade_code(company: Dict) -> int:
+    """Index into GRADE_RANGES for a company's qualification grade"""
+    return _GRADE_CODES.get(_safe_nested(company, 'qualification_details', 'score_breakdown', 'grade'), 4)
+
+# xlsxwriter format for header cells
+HEADER_FORMAT = {"bold": True, "bg_color": "#366092", "font_color": "#FFFFFF", "align": "center", "valign": "vcenter"}
+
 class ReportGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -26,18 +93,20 @@ class ReportGenerator:
             return None
         
         # Create output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read per report, shared by the filename, outreach templates and summary sheet
+        report_time = datetime.now()
+        timestamp = report_time.strftime("%Y%m%d_%H%M%S")
         if not output_path:
             # Save to Downloads folder by default
             downloads_path = os.path.expanduser("~/Downloads")
             output_path = os.path.join(downloads_path, f"transition_scout_leads_{timestamp}.xlsx")
         
         # Prepare data for export
-        export_data = self._prepare_export_data(qualified_companies)
+        export_data = self._prepare_export_data(qualified_companies, report_time.year)
         
         # Create reports based on configuration
         if OUTPUT_CONFIG["output_format"] in ["excel", "both"]:
-            self._create_excel_report(export_data, output_path)
+            self._create_excel_report(export_data, output_path, report_time)
         
         if OUTPUT_CONFIG["output_format"] in ["csv", "both"]:
             # Create CSV version - save as leads.csv
@@ -49,92 +118,100 @@ class ReportGenerator:
         self.logger.info(f"Lead report generated: {output_path}")
         return output_path
     
-    def _prepare_export_data(self, qualified_companies: List[Dict]) -> Dict:
-        """Prepare data for export with all necessary columns"""
-        export_data = {
-            'companies': [],
-            'decision_makers': [],
-            'outreach_templates': []
-        }
-        
+    def _prepare_export_data(self, qualified_companies: List[Dict], current_year: int) -> Dict[str, List]:
+        """Prepare data for export with all necessary columns, as rows in each table's column order"""
+        # One pass over the companies fills both tables; rows are tuples, not per-row dicts
+        company_rows = []
+        decision_maker_rows = []
         for company in qualified_companies:
+            company_name = company.get('company_name', '')
+            
             # Company data
-            company_row = {
-                'Company Name': company.get('company_name', ''),
-                'Industry': company.get('industry', ''),
-                'Location': company.get('location', ''),
-                'Employee Count': company.get('employee_count', ''),
-                'Revenue Range': company.get('revenue_range', ''),
-                'Business Age (Years)': company.get('business_age', ''),
-                'Website': company.get('website', ''),
-                'Phone': company.get('phone', ''),
-                'LinkedIn URL': company.get('linkedin_url', ''),
-                'Qualification Score': company.get('qualification_score', 0),
-                'Grade': company.get('qualification_details', {}).get('score_breakdown', {}).get('grade', ''),
-                'Contact Score': company.get('qualification_details', {}).get('criteria_checks', {}).get('contact_information', {}).get('score', 0)
-            }
-            export_data['companies'].append(company_row)
+            company_rows.append((
+                company_name,
+                company.get('industry', ''),
+                company.get('location', ''),
+                company.get('employee_count', ''),
+                company.get('revenue_range', ''),
+                company.get('business_age', ''),
+                company.get('website', ''),
+                company.get('phone', ''),
+                company.get('linkedin_url', ''),
+                company.get('qualification_score', 0),
+                _safe_nested(company, 'qualification_details', 'score_breakdown', 'grade', default=''),
+                _safe_nested(company, 'qualification_details', 'criteria_checks', 'contact_information', 'score', default=0)
+            ))
             
             # Decision makers data
-            decision_makers = company.get('decision_makers', [])
-            for dm in decision_makers:
-                dm_row = {
-                    'Company Name': company.get('company_name', ''),
-                    'Decision Maker Name': dm.get('name', ''),
-                    'Title': dm.get('title', ''),
-                    'Email': dm.get('email', ''),
-                    'Phone': dm.get('phone', ''),
-                    'LinkedIn URL': dm.get('linkedin_url', '')
-                }
-                export_data['decision_makers'].append(dm_row)
-            
-            # Outreach templates
-            if OUTPUT_CONFIG["include_outreach_templates"]:
-                template_row = self._generate_outreach_template(company)
-                export_data['outreach_templates'].append(template_row)
+            for dm in company.get('decision_makers', []):
+                decision_maker_rows.append((
+                    company_name,
+                    dm.get('name', ''),
+                    dm.get('title', ''),
+                    dm.get('email', ''),
+                    dm.get('phone', ''),
+                    dm.get('linkedin_url', '')
+                ))
+        
+        # Outreach templates
+        templates = self._render_outreach_templates(qualified_companies, current_year) if OUTPUT_CONFIG["include_outreach_templates"] else []
         
-        return export_data
+        return {
+            'companies': company_rows,
+            'decision_makers': decision_maker_rows,
+            'outreach_templates': templates
+        }
     
-    def _generate_outreach_template(self, company: Dict) -> Dict:
+    def _render_outreach_templates(self, companies: List[Dict], current_year: int) -> List[Tuple]:
+        """Generate every company's outreach template, across threads when they can run in parallel"""
+        render = partial(self._generate_outreach_template, current_year=current_year)
+        
+        # Under the GIL, threads would only interleave this pure-Python string work
+        if _gil_enabled() or len(companies) < _PARALLEL_MIN_TEMPLATES:
+            return list(map(render, companies))
+        
+        with ThreadPoolExecutor(max_workers=min(OUTPUT_CONFIG["template_workers"], len(companies))) as executor:
+            return list(executor.map(render, companies))
+    
+    def _generate_outreach_template(self, company: Dict, current_year: int) -> Tuple:
         """Generate personalized outreach template for a company"""
         # Get primary decision maker
         decision_makers = company.get('decision_makers', [])
         primary_contact = decision_makers[0] if decision_makers else {}
+        contact_name = primary_contact.get('name', '')
+        company_name = company.get('company_name', '')
         
         # Calculate business age
         business_age = company.get('business_age', '')
-        if not business_age and company.get('founded_year'):
-            try:
-                current_year = datetime.now().year
-                business_age = current_year - int(company['founded_year'])
-            except:
+        founded_year = company.get('founded_year')
+        if not business_age and founded_year:
+            if isinstance(founded_year, int) or (isinstance(founded_year, str) and founded_year.isdigit()):
+                business_age = current_year - int(founded_year)
+            else:
                 business_age = 'Unknown'
         
-        # Personalize templates
-        email_body = OUTREACH_TEMPLATES["email_body"].format(
-            first_name=primary_contact.get('name', '').split()[0] if primary_contact.get('name') else 'there',
-            company_name=company.get('company_name', ''),
-            business_age=business_age,
-            your_name='[Your Name]'
-        )
-        
-        linkedin_message = OUTREACH_TEMPLATES["linkedin_message"].format(
-            first_name=primary_contact.get('name', '').split()[0] if primary_contact.get('name') else 'there',
-            company_name=company.get('company_name', ''),
-            business_age=business_age,
-            your_name='[Your Name]'
-        )
-        
-        return {
-            'Company Name': company.get('company_name', ''),
-            'Primary Contact': primary_contact.get('name', ''),
-            'Contact Title': primary_contact.get('title', ''),
-            'Email Subject': OUTREACH_TEMPLATES["email_subject"],
-            'Email Body': email_body,
-            'LinkedIn Message': linkedin_message,
-            'Best Contact Method': self._determine_best_contact_method(company),
-            'Follow-up Timeline': '3-5 business days'
+        # Personalize templates from one shared set of fields
+        context = {
+            # maxsplit stops after the first word; only it is needed
+            'first_name': contact_name.split(None, 1)[0] if contact_name else 'there',
+            'company_name': company_name,
+            'business_age': business_age,
+            'your_name': '[Your Name]'
         }
+        email_body = _render(_EMAIL_TEMPLATE_PARTS, context)
+        linkedin_message = _render(_LINKEDIN_TEMPLATE_PARTS, context)
+        
+        # In OUTREACH_TEMPLATE_COLUMNS order
+        return (
+            company_name,
+            contact_name,
+            primary_contact.get('title', ''),
+            _EMAIL_SUBJECT,
+            email_body,
+            linkedin_message,
+            self._determine_best_contact_method(company),
+            '3-5 business days'
+        )
     
     def _determine_best_contact_method(self, company: Dict) -> str:
         """Determine the best method to contact a company"""
@@ -152,186 +229,81 @@ class ReportGenerator:
         else:
             return 'Website Contact Form'
     
-    def _create_excel_report(self, export_data: Dict, output_path: str):
+    def _create_excel_report(self, export_data: Dict, output_path: str, report_time: datetime):
         """Create comprehensive Excel report with multiple sheets"""
-        workbook = openpyxl.Workbook()
-        
-        # Remove default sheet
-        workbook.remove(workbook.active)
-        
-        # Create sheets
-        self._create_companies_sheet(workbook, export_data['companies'])
-        self._create_decision_makers_sheet(workbook, export_data['decision_makers'])
+        # Imported here so runs that never write a report don't pay for it
+        import xlsxwriter
         
-        if OUTPUT_CONFIG["include_outreach_templates"]:
-            self._create_outreach_sheet(workbook, export_data['outreach_templates'])
-        
-        # Create summary sheet
-        self._create_summary_sheet(workbook, export_data)
-        
-        # Save workbook
-        workbook.save(output_path)
-    
-    def _create_companies_sheet(self, workbook: openpyxl.Workbook, companies_data: List[Dict]):
-        """Create companies overview sheet"""
-        sheet = workbook.create_sheet("Qualified Companies")
-        
-        # Convert to DataFrame and write
-        df = pd.DataFrame(companies_data)
-        for row in dataframe_to_rows(df, index=False, header=True):
-            sheet.append(row)
-        
-        # Format headers
-        self._format_headers(sheet, len(df.columns))
-        
-        # Auto-adjust column widths
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            sheet.column_dimensions[column_letter].width = adjusted_width
-    
-    def _create_decision_makers_sheet(self, workbook: openpyxl.Workbook, decision_makers_data: List[Dict]):
-        """Create decision makers contact sheet"""
-        sheet = workbook.create_sheet("Decision Makers")
-        
-        df = pd.DataFrame(decision_makers_data)
-        for row in dataframe_to_rows(df, index=False, header=True):
-            sheet.append(row)
-        
-        self._format_headers(sheet, len(df.columns))
-        
-        # Auto-adjust column widths
-        for column in sheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            sheet.column_dimensions[column_letter].width = adjusted_width
-    
-    def _create_outreach_sheet(self, workbook: openpyxl.Workbook, outreach_data: List[Dict]):
-        """Create outreach templates sheet"""
-        sheet = workbook.create_sheet("Outreach Templates")
-        
-        df = pd.DataFrame(outreach_data)
-        for row in dataframe_to_rows(df, index=False, header=True):
-            sheet.append(row)
-        
-        self._format_headers(sheet, len(df.columns))
-        
-        # Auto-adjust column widths for outreach templates
-        for column in sheet.columns:
-            column_letter = column[0].column_letter
-            if column_letter in ['E', 'F', 'G']:  # Email body, LinkedIn message columns
-                sheet.column_dimensions[column_letter].width = 60
-            else:
-                sheet.column_dimensions[column_letter].width = 20
-    
-    def _create_summary_sheet(self, workbook: openpyxl.Workbook, export_data: Dict):
-        """Create summary statistics sheet"""
-        sheet = workbook.create_sheet("Summary")
-        
-        # Summary statistics
-        summary_data = [
-            ["Report Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            ["Total Companies Found", len(export_data['companies'])],
-            ["Total Decision Makers", len(export_data['decision_makers'])],
-            ["Outreach Templates Generated", len(export_data['outreach_templates'])],
-            ["", ""],
-            ["Target Criteria", ""],
-            ["Employee Range", "50-500"],
-            ["Revenue Range", "$5M - $100M"],
-            ["Business Age Minimum", "15+ years"],
-            ["Target Industries", ", ".join(["Manufacturing", "Construction", "Professional Services", "Healthcare"])]
+        sheets = [
+            ("Qualified Companies", EXPORT_COMPANY_COLUMNS, export_data['companies']),
+            ("Decision Makers", EXPORT_DECISION_MAKER_COLUMNS, export_data['decision_makers'])
         ]
+        if OUTPUT_CONFIG["include_outreach_templates"]:
+            sheets.append(("Outreach Templates", OUTREACH_TEMPLATE_COLUMNS, export_data['outreach_templates']))
         
-        for row in summary_data:
-            sheet.append(row)
-        
-        # Format summary
-        for row in range(1, len(summary_data) + 1):
-            if row <= 4:  # Header rows
-                sheet[f"A{row}"].font = Font(bold=True)
-                sheet[f"A{row}"].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                sheet[f"A{row}"].font = Font(color="FFFFFF", bold=True)
+        with xlsxwriter.Workbook(output_path) as workbook:
+            header_format = workbook.add_format(HEADER_FORMAT)
+            
+            for sheet_name, columns, rows in sheets:
+                # Rows go straight from the export tuples to the sheet, without a DataFrame in between
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, columns, header_format)
+                for row_index, row in enumerate(rows, 1):
+                    worksheet.write_row(row_index, 0, row)
+                
+                if sheet_name == "Outreach Templates":
+                    # Email body, LinkedIn message columns
+                    worksheet.set_column("A:Z", 20)
+                    worksheet.set_column("E:G", 60)
+                else:
+                    self._autosize(worksheet, columns, rows)
+            
+            # Summary statistics
+            summary_data = [
+                ["Report Generated", report_time.strftime("%Y-%m-%d %H:%M:%S")],
+                ["Total Companies Found", len(export_data['companies'])],
+                ["Total Decision Makers", len(export_data['decision_makers'])],
+                ["Outreach Templates Generated", len(export_data['outreach_templates'])],
+                ["", ""],
+                ["Target Criteria", ""],
+                ["Employee Range", "50-500"],
+                ["Revenue Range", "$5M - $100M"],
+                ["Business Age Minimum", "15+ years"],
+                ["Target Industries", ", ".join(["Manufacturing", "Construction", "Professional Services", "Healthcare"])]
+            ]
+            summary_sheet = workbook.add_worksheet("Summary")
+            for row, (label, value) in enumerate(summary_data):
+                # The first four rows are headers
+                summary_sheet.write(row, 0, label, header_format if row < 4 else None)
+                summary_sheet.write(row, 1, value)
     
-    def _format_headers(self, sheet: Worksheet, num_columns: int):
-        """Format header row with styling"""
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        
-        for col in range(1, num_columns + 1):
-            cell = sheet.cell(row=1, column=col)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
+    @staticmethod
+    def _autosize(worksheet, columns: Tuple[str, ...], rows: List[Tuple]):
+        """Auto-adjust column widths to the longest value, capped at 50, in one scan per column"""
+        values_by_column = zip(*rows) if rows else ((),) * len(columns)
+        for index, (column, values) in enumerate(zip(columns, values_by_column)):
+            # Blank cells are written empty, so None counts as zero width
+            width = max((len(str(value)) for value in values if value is not None), default=0)
+            worksheet.set_column(index, index, min(max(width, len(column)) + 2, 50))
     
-    def _create_csv_report(self, export_data: Dict, output_path: str):
+    def _create_csv_report(self, export_data: Dict[str, List], output_path: str):
         """Create CSV report with companies and decision makers"""
-        # Combine companies with their decision makers for a comprehensive CSV
-        combined_data = []
-        
-        for company in export_data['companies']:
-            decision_makers = export_data['decision_makers']
-            company_dms = [dm for dm in decision_makers if dm['Company Name'] == company['Company Name']]
+        # Group decision makers by company once instead of scanning them all for every company
+        decision_makers_by_company = defaultdict(list)
+        for dm in export_data['decision_makers']:
+            decision_makers_by_company[dm[0]].append(dm[1:])
+        
+        # Rows go straight to disk as they are built; no joined table is held in memory
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            # Same line endings to_csv wrote
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(CSV_COLUMNS)
             
-            if company_dms:
-                # Create a row for each decision maker
-                for dm in company_dms:
-                    combined_row = {
-                        'Company Name': company['Company Name'],
-                        'Industry': company['Industry'],
-                        'Location': company['Location'],
-                        'Employee Count': company['Employee Count'],
-                        'Revenue Range': company['Revenue Range'],
-                        'Business Age (Years)': company['Business Age (Years)'],
-                        'Website': company['Website'],
-                        'Phone': company['Phone'],
-                        'Qualification Score': company['Qualification Score'],
-                        'Grade': company['Grade'],
-                        'Contact Name': dm['Decision Maker Name'],
-                        'Contact Title': dm['Title'],
-                        'Contact Email': dm['Email'],
-                        'Contact Phone': dm['Phone'],
-                        'Contact LinkedIn': dm['LinkedIn URL']
-                    }
-                    combined_data.append(combined_row)
-            else:
+            for company in export_data['companies']:
+                company_columns = _csv_company_fields(company)
                 # If no decision makers, still include the company
-                combined_row = {
-                    'Company Name': company['Company Name'],
-                    'Industry': company['Industry'],
-                    'Location': company['Location'],
-                    'Employee Count': company['Employee Count'],
-                    'Revenue Range': company['Revenue Range'],
-                    'Business Age (Years)': company['Business Age (Years)'],
-                    'Website': company['Website'],
-                    'Phone': company['Phone'],
-                    'Qualification Score': company['Qualification Score'],
-                    'Grade': company['Grade'],
-                    'Contact Name': 'N/A',
-                    'Contact Title': 'N/A',
-                    'Contact Email': 'N/A',
-                    'Contact Phone': 'N/A',
-                    'Contact LinkedIn': 'N/A'
-                }
-                combined_data.append(combined_row)
-        
-        # Create DataFrame and save as CSV
-        df = pd.DataFrame(combined_data)
-        df.to_csv(output_path, index=False)
+                for contact in decision_makers_by_company.get(company[0]) or (_CSV_NO_CONTACT,):
+                    writer.writerow(company_columns + contact)
         
         self.logger.info(f"CSV report generated: {output_path}")
     
@@ -342,35 +314,17 @@ class ReportGenerator:
         
         # Calculate statistics
         total_companies = len(companies)
-        qualified_companies = [c for c in companies if c.get('qualification_score', 0) >= 70]
-        qualified_count = len(qualified_companies)
+        scores = np.fromiter((c.get('qualification_score', 0) for c in companies), dtype=np.float64, count=total_companies)
+        qualified_count = int((scores >= 70).sum())
         
-        # Score distribution
-        score_ranges = {
-            'A (90-100)': 0,
-            'B (80-89)': 0,
-            'C (70-79)': 0,
-            'D (60-69)': 0,
-            'F (0-59)': 0
-        }
-        
-        for company in companies:
-            grade = company.get('qualification_details', {}).get('score_breakdown', {}).get('grade', 'F')
-            if grade == 'A':
-                score_ranges['A (90-100)'] += 1
-            elif grade == 'B':
-                score_ranges['B (80-89)'] += 1
-            elif grade == 'C':
-                score_ranges['C (70-79)'] += 1
-            elif grade == 'D':
-                score_ranges['D (60-69)'] += 1
-            else:
-                score_ranges['F (0-59)'] += 1
+        # Score distribution: one grade code per company, counted in a single bincount
+        grades = np.fromiter((_grade_code(c) for c in companies), dtype=np.int8, count=total_companies)
+        score_ranges = dict(zip(GRADE_RANGES, np.bincount(grades, minlength=len(GRADE_RANGES)).tolist()))
         
         return {
             'total_companies_analyzed': total_companies,
             'qualified_companies': qualified_count,
             'qualification_rate': (qualified_count / total_companies * 100) if total_companies > 0 else 0,
             'score_distribution': score_ranges,
-            'average_qualification_score': sum(c.get('qualification_score', 0) for c in companies) / total_companies if total_companies > 0 else 0
+            'average_qualification_score': float(scores.mean()) if total_companies > 0 else 0
         }
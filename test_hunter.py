@@ -4,9 +4,15 @@ Test script for Hunter.io API integration
 """
 
 import os
+import orjson
 import requests
 from dotenv import load_dotenv
 
+from data_collectors.http_session import configure_session
+
+# Pooled keep-alive session, so repeated lookups reuse the TLS connection
+_session = configure_session(requests.Session(), pool_connections=8, pool_maxsize=32)
+
 def test_hunter_api():
     """Test Hunter.io API with a sample domain"""
     
@@ -40,10 +46,10 @@ def test_hunter_api():
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("✅ Hunter.io API working!")
             print(f"📧 Found {data.get('data', {}).get('emails', [])} emails")
             print(f"👥 Found {data.get('data', {}).get('people', [])} people")